@@ -0,0 +1,380 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-15
+"""
+
+import errno
+import os
+import re
+import stat
+import sys
+
+from functools import lru_cache
+from typing import Any, Final, List, Optional, Tuple
+
+
+__all__: Final[List[str]] = [
+    "is_available",
+    "read_files",
+]
+
+
+# The oldest kernel release that supports IORING_OP_READ
+_MIN_KERNEL: Final[Tuple[int, int]] = (5, 6)
+
+# The maximum number of reads submitted to the ring at once
+_QUEUE_DEPTH: Final[int] = 256
+
+# The size of the chunks read from files that report a size of 0
+_CHUNK_SIZE: Final[int] = 64 * 1024
+
+
+def _kernel_version() -> Tuple[int, int]:
+    """
+    Returns the major and minor version of the running kernel
+
+    :return: The major and minor version of the running kernel, (0, 0) if it cannot be parsed
+    :rtype: Tuple[int, int]
+    """
+
+    # Match the leading "major.minor" part of the release string (e.g. "6.8.0-45-generic")
+    match = re.match(
+        r"(\d+)\.(\d+)",
+        os.uname().release,
+    )
+
+    # Check if the release string could be parsed
+    if not match:
+        # Return the lowest possible version
+        return (0, 0)
+
+    # Return the major and minor version
+    return (
+        int(match.group(1)),
+        int(match.group(2)),
+    )
+
+
+@lru_cache(maxsize=None)
+def is_available() -> bool:
+    """
+    Checks if io_uring can be used on this host
+
+    :return: True if the platform, the kernel and the liburing bindings support io_uring, False otherwise
+    :rtype: bool
+    """
+
+    # Check if the platform is Linux and the kernel is recent enough
+    if sys.platform != "linux" or _kernel_version() < _MIN_KERNEL:
+        # Return False
+        return False
+
+    try:
+        # Check if the optional liburing bindings are installed
+        import liburing  # noqa: F401
+    except ImportError:
+        # Return False
+        return False
+
+    # Return True
+    return True
+
+
+def _batch_size() -> int:
+    """
+    Returns the number of files to open at once
+
+    :return: _QUEUE_DEPTH, capped at half the soft RLIMIT_NOFILE to leave descriptors for the rest of the process
+    :rtype: int
+    """
+
+    # Import the POSIX-only resource module lazily (this only runs once is_available() has confirmed Linux)
+    import resource
+
+    # Get the soft limit of open file descriptors
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+
+    # Check if the limit is unlimited
+    if soft == resource.RLIM_INFINITY:
+        # Return the queue depth
+        return _QUEUE_DEPTH
+
+    # Return the queue depth, capped at half the limit
+    return max(
+        1,
+        min(
+            _QUEUE_DEPTH,
+            soft // 2,
+        ),
+    )
+
+
+def _read_to_eof(fd: int) -> Optional[bytes]:
+    """
+    Reads an open file of unknown size until EOF
+
+    :param fd: The file descriptor to read from
+    :type fd: int
+
+    :return: The content of the file if it was read, None otherwise
+    :rtype: Optional[bytes]
+    """
+
+    # Initialize the list of chunks
+    chunks: List[bytes] = []
+
+    try:
+        while True:
+            # Read the next chunk
+            chunk = os.read(
+                fd,
+                _CHUNK_SIZE,
+            )
+
+            # Check if the end of the file was reached
+            if not chunk:
+                break
+
+            # Add the chunk
+            chunks.append(chunk)
+    except OSError:
+        # Return None
+        return None
+
+    # Return the content of the file
+    return b"".join(chunks)
+
+
+def _read_batch(
+    ring: Any,
+    cqe: Any,
+    paths: List[str],
+    results: List[Optional[bytes]],
+    start: int,
+) -> None:
+    """
+    Reads a batch of files through the ring, holding their file descriptors only for the batch
+
+    :param ring: The initialized ring
+    :type ring: Any
+    :param cqe: The completion queue entry to reap into
+    :type cqe: Any
+    :param paths: The paths of this batch
+    :type paths: List[str]
+    :param results: The results of all files, filled in place
+    :type results: List[Optional[bytes]]
+    :param start: The index of the first path of this batch in the results
+    :type start: int
+
+    :raises OSError: If the process runs out of file descriptors (EMFILE or ENFILE)
+
+    :return: None
+    :rtype: None
+    """
+
+    # Import the optional liburing bindings lazily
+    from liburing import (
+        io_uring_cqe_get_data64,
+        io_uring_cqe_seen,
+        io_uring_get_sqe,
+        io_uring_prep_read,
+        io_uring_sqe_set_data64,
+        io_uring_submit_and_wait,
+        io_uring_wait_cqe,
+    )
+
+    # Initialize the file descriptors of this batch (-1 for files that were not opened)
+    fds: List[int] = []
+
+    # Initialize the buffers of this batch
+    buffers: List[bytearray] = []
+
+    # Initialize the batch-relative indices whose reads have to be submitted
+    pending: List[int] = []
+
+    try:
+        for index, path in enumerate(paths):
+            try:
+                # Open the file
+                fd = os.open(
+                    path,
+                    os.O_RDONLY,
+                )
+            except OSError as exception:
+                # Check if the process ran out of file descriptors (not a property of the file)
+                if exception.errno in (errno.EMFILE, errno.ENFILE):
+                    raise
+
+                # Keep the slot aligned and skip the file
+                fds.append(-1)
+                buffers.append(bytearray())
+
+                continue
+
+            # Add the file descriptor
+            fds.append(fd)
+
+            # Get the status of the opened file
+            status = os.fstat(fd)
+
+            # Check if the path is a regular file
+            if not stat.S_ISREG(status.st_mode):
+                # Keep the slot aligned and skip the file
+                buffers.append(bytearray())
+
+                continue
+
+            # Add a buffer sized to the file
+            buffers.append(bytearray(status.st_size))
+
+            # Check if the file reports a size of 0
+            if not buffers[index]:
+                # The size is unknown (e.g. procfs pseudo-files report 0), so read to EOF synchronously
+                results[start + index] = _read_to_eof(fd)
+
+                continue
+
+            # Add the index to the pending reads
+            pending.append(index)
+
+        # Check if anything has to be read
+        if not pending:
+            return
+
+        for index in pending:
+            # Fill one submission queue entry per file
+            sqe = io_uring_get_sqe(ring)
+
+            io_uring_prep_read(
+                sqe,
+                fds[index],
+                buffers[index],
+                0,
+            )
+
+            io_uring_sqe_set_data64(
+                sqe,
+                index,
+            )
+
+        # Submit the whole batch with a single io_uring_enter
+        io_uring_submit_and_wait(
+            ring,
+            len(pending),
+        )
+
+        for _ in pending:
+            # Reap the next completion
+            io_uring_wait_cqe(
+                ring,
+                cqe,
+            )
+
+            entry = cqe[0]
+
+            index = io_uring_cqe_get_data64(entry)
+
+            try:
+                # Get the number of bytes read (raises on a negative errno)
+                result = entry.res
+            except OSError:
+                # Mark the read as failed
+                result = -1
+
+            io_uring_cqe_seen(
+                ring,
+                entry,
+            )
+
+            # Check if the read failed
+            if result < 0:
+                continue
+
+            buffer = buffers[index]
+
+            # Complete short reads synchronously
+            while result < len(buffer):
+                chunk = os.pread(
+                    fds[index],
+                    len(buffer) - result,
+                    result,
+                )
+
+                # Check if the file shrank in the meantime
+                if not chunk:
+                    del buffer[result:]
+
+                    break
+
+                buffer[result : result + len(chunk)] = chunk
+                result += len(chunk)
+
+            # Add the result
+            results[start + index] = bytes(buffer)
+    finally:
+        for fd in fds:
+            # Check if the file was opened
+            if fd >= 0:
+                # Close the file
+                os.close(fd)
+
+
+def read_files(paths: List[str]) -> List[Optional[bytes]]:
+    """
+    Reads the files at the given paths through a single io_uring instance
+
+    :param paths: The paths to read the files at
+    :type paths: List[str]
+
+    :raises OSError: If the process runs out of file descriptors (EMFILE or ENFILE)
+
+    :return: The content of each file, None for each file that could not be read
+    :rtype: List[Optional[bytes]]
+
+    Note: The files are opened, read and closed in batches of at most _QUEUE_DEPTH
+    (and at most half the soft RLIMIT_NOFILE), so the descriptors of one batch are open at once
+    """
+
+    # Import the optional liburing bindings lazily
+    from liburing import (
+        Cqe,
+        Ring,
+        io_uring_queue_exit,
+        io_uring_queue_init,
+    )
+
+    # Initialize the list of results
+    results: List[Optional[bytes]] = [None] * len(paths)
+
+    # Initialize the ring and the completion queue entry
+    ring = Ring()
+    cqe = Cqe()
+
+    io_uring_queue_init(
+        _QUEUE_DEPTH,
+        ring,
+    )
+
+    # Get the number of files to open at once
+    size: int = _batch_size()
+
+    try:
+        for start in range(
+            0,
+            len(paths),
+            size,
+        ):
+            # Read the next batch, closing its files before the next one is opened
+            _read_batch(
+                cqe=cqe,
+                paths=paths[start : start + size],
+                results=results,
+                ring=ring,
+                start=start,
+            )
+    finally:
+        # Tear down the ring
+        io_uring_queue_exit(ring)
+
+    # Return the results
+    return results
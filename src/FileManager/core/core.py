@@ -3,63 +3,1804 @@ Author: Louis Goodnews
 Date: 2025-08-19
 """
 
-import aiofiles
 import asyncio
+import ctypes
+import errno
+import logging
 import os
 import shutil
+import stat
 import sys
-import traceback
+import tarfile
+import threading
+import zipfile
 
-from datetime import datetime
-from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
 from pathlib import Path
 from pyunpack import Archive
 from tkinter import filedialog
-from typing import Final, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from . import _uring
 
 
 __all__: Final[List[str]] = ["FileManager"]
 
 
-class FileTask(Enum):
+# The result type of a file dialog (e.g. str for askopenfilename)
+_DialogResult = TypeVar("_DialogResult")
+
+
+# Initialize the logger shared by all file operations
+logger: Final[logging.Logger] = logging.getLogger("FileManager")
+
+# Leave the output to the host application (its handlers receive the records through propagation)
+logger.addHandler(logging.NullHandler())
+
+
+class FileTask(IntEnum):
+    """
+    The FileTask enum is an integer enum that represents the different file operations.
+
+    Attributes:
+    ----------
+    COPY: Copy a file
+    CREATE: Create a file
+    DELETE: Delete a file
+    EXISTS: Check if a file or directory exists
+    EMPTY: Check if a file or directory is empty
+    LINK: Create a symlink
+    MOVE: Move a file
+    READ: Read a file
+    RENAME: Rename a file
+    UNPACK: Unpack an archive
+    WRITE: Write to a file
+    """
+
+    COPY = 0
+    CREATE = 1
+    DELETE = 2
+    EXISTS = 3
+    EMPTY = 4
+    LINK = 5
+    MOVE = 6
+    READ = 7
+    RENAME = 8
+    UNPACK = 9
+    WRITE = 10
+
+    def __str__(self) -> str:
+        """
+        Returns the string representation of the enum member.
+
+        :return: The string representation of the enum member
+        :rtype: str
+        """
+
+        # Return the lower-cased name of the enum member (e.g. "copy")
+        return self.name.lower()
+
+
+# The concrete Path subclass instantiated on this platform (PosixPath or WindowsPath)
+_PATH_TYPE: Final[type] = type(Path())
+
+
+def _to_path(path: Union[str, Path]) -> Path:
+    """
+    Converts the given path to a Path object
+
+    :param path: The path to convert
+    :type path: Union[str, Path]
+
+    :return: The converted path
+    :rtype: Path
+    """
+
+    # Get the exact type of the path
+    kind: type = path.__class__
+
+    # Check if the path already is a Path object
+    if kind is _PATH_TYPE:
+        # Return the path unchanged (the exact-type check is not visible to type checkers)
+        return cast(Path, path)
+
+    # Convert the path (other path-like objects are reduced to a string first)
+    return Path(path if kind is str else os.fspath(path))
+
+
+def _is_dir(path: Union[str, Path]) -> bool:
+    """
+    Checks if a directory exists at the given path, without converting it
+
+    :param path: The path to check
+    :type path: Union[str, Path]
+
+    :return: True if the directory exists, False otherwise
+    :rtype: bool
+    """
+
+    # Return whether the directory exists (a single GetFileAttributesW call on Windows)
+    return os.path.isdir(path)
+
+
+def _is_file(path: Union[str, Path]) -> bool:
+    """
+    Checks if a file exists at the given path, without converting it
+
+    :param path: The path to check
+    :type path: Union[str, Path]
+
+    :return: True if the file exists, False otherwise
+    :rtype: bool
+    """
+
+    # Return whether the file exists (a single GetFileAttributesW call on Windows)
+    return os.path.isfile(path)
+
+
+# The flags used to create a copy destination (O_BINARY only exists on Windows)
+_COPY_FLAGS: Final[int] = (
+    os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+)
+
+# The size of the per-thread buffer used when no in-kernel copy method is available
+_COPY_BUFFER_SIZE: Final[int] = 256 * 1024
+
+# The size below which files are copied with a single read and write
+_SMALL_FILE_SIZE: Final[int] = 64 * 1024
+
+# The number of threads copying the files of a directory tree in parallel
+_COPY_WORKERS: Final[int] = min(32, (os.cpu_count() or 1) * 4)
+
+# Whether os.sendfile accepts a regular file as its output (elsewhere it requires a socket)
+_SENDFILE_TO_FILE: Final[bool] = sys.platform == "linux" and hasattr(os, "sendfile")
+
+# The thread-local storage holding each thread's copy buffer
+_COPY_LOCAL: Final[threading.local] = threading.local()
+
+# The errors signalling that an in-kernel copy method is unsupported for the given files
+_COPY_UNSUPPORTED: Final[FrozenSet[int]] = frozenset(
+    {
+        errno.EINVAL,
+        errno.ENOSYS,
+        errno.ENOTSOCK,
+        errno.EOPNOTSUPP,
+        errno.EXDEV,
+        getattr(errno, "ENOTSUP", errno.EOPNOTSUPP),
+    }
+)
+
+
+def _copy_in_kernel(
+    source_fd: int,
+    destination_fd: int,
+    size: int,
+) -> bool:
+    """
+    Copies the content of one file descriptor to another without a user-space buffer
+
+    :param source_fd: The file descriptor to copy from
+    :type source_fd: int
+    :param destination_fd: The file descriptor to copy to
+    :type destination_fd: int
+    :param size: The size of the source file
+    :type size: int
+
+    :return: True if the content was copied, False if no in-kernel method is available
+    :rtype: bool
+    """
+
+    # Copy in chunks of at least 8 MiB (files in e.g. /proc report a size of 0)
+    blocksize: int = min(
+        max(
+            size,
+            2**23,
+        ),
+        2**30,
+    )
+
+    # Initialize the number of bytes copied
+    offset: int = 0
+
+    # Check if copy_file_range is available (Linux, may reflink on CoW filesystems)
+    if hasattr(os, "copy_file_range"):
+        try:
+            while True:
+                # Copy the next chunk
+                copied = os.copy_file_range(
+                    source_fd,
+                    destination_fd,
+                    blocksize,
+                )
+
+                # Check if the end of the file was reached
+                if not copied:
+                    break
+
+                offset += copied
+        except OSError as exception:
+            # Check if the error is unrelated to the support of copy_file_range
+            if offset or exception.errno not in _COPY_UNSUPPORTED:
+                raise
+
+        # Check if anything was copied (some filesystems report 0 instead of failing)
+        if offset:
+            # Return True
+            return True
+
+    # Check if sendfile can copy between regular files (Linux only, ENOTSOCK on macOS and BSD)
+    if _SENDFILE_TO_FILE:
+        try:
+            while True:
+                # Copy the next chunk
+                copied = os.sendfile(
+                    destination_fd,
+                    source_fd,
+                    offset,
+                    blocksize,
+                )
+
+                # Check if the end of the file was reached
+                if not copied:
+                    break
+
+                offset += copied
+        except OSError as exception:
+            # Check if the error is unrelated to the support of sendfile
+            if offset or exception.errno not in _COPY_UNSUPPORTED:
+                raise
+
+            # Return False
+            return False
+
+        # Return True
+        return True
+
+    # Return False
+    return False
+
+
+def _copy_buffer() -> memoryview:
+    """
+    Returns the copy buffer of the current thread, allocating it on first use
+
+    :return: A view of the current thread's copy buffer
+    :rtype: memoryview
+    """
+
+    # Get this thread's copy buffer
+    buffer: Optional[memoryview] = getattr(
+        _COPY_LOCAL,
+        "buffer",
+        None,
+    )
+
+    # Check if this thread has no copy buffer yet
+    if buffer is None:
+        # Allocate the copy buffer once per thread
+        buffer = _COPY_LOCAL.buffer = memoryview(bytearray(_COPY_BUFFER_SIZE))
+
+    # Return the copy buffer
+    return buffer
+
+
+def _copy_buffered(
+    source_fd: int,
+    destination_fd: int,
+) -> None:
+    """
+    Copies the content of one file descriptor to another through a reused per-thread buffer
+
+    :param source_fd: The file descriptor to copy from
+    :type source_fd: int
+    :param destination_fd: The file descriptor to copy to
+    :type destination_fd: int
+
+    :return: None
+    :rtype: None
+    """
+
+    # Get this thread's copy buffer
+    view: memoryview = _copy_buffer()
+
+    with open(
+        source_fd,
+        mode="rb",
+        buffering=0,
+        closefd=False,
+    ) as source:
+        while True:
+            # Read the next chunk into the buffer
+            read = source.readinto(view)
+
+            # Check if the end of the file was reached
+            if not read:
+                break
+
+            # Write the chunk (os.write may write less than requested)
+            written: int = 0
+
+            while written < read:
+                written += os.write(
+                    destination_fd,
+                    view[written:read],
+                )
+
+
+def _copy_small(
+    source_fd: int,
+    destination_fd: int,
+    size: int,
+) -> None:
+    """
+    Copies the content of a small file with one read and one write
+
+    :param source_fd: The file descriptor to copy from
+    :type source_fd: int
+    :param destination_fd: The file descriptor to copy to
+    :type destination_fd: int
+    :param size: The size of the source file
+    :type size: int
+
+    :return: None
+    :rtype: None
+    """
+
+    # Read the whole file at once
+    content: bytes = os.read(
+        source_fd,
+        size,
+    )
+
+    # Complete short reads (rare for regular files)
+    while len(content) < size:
+        chunk: bytes = os.read(
+            source_fd,
+            size - len(content),
+        )
+
+        # Check if the file shrank in the meantime
+        if not chunk:
+            break
+
+        content += chunk
+
+    # Write the whole file at once
+    view: memoryview = memoryview(content)
+
+    written: int = 0
+
+    while written < len(view):
+        written += os.write(
+            destination_fd,
+            view[written:],
+        )
+
+
+def _copy_file_contents(
+    source: Union[str, Path],
+    destination: Union[str, Path],
+) -> None:
+    """
+    Copies the content of a file to a new file, in-kernel where possible
+
+    :param source: The file to copy
+    :type source: Union[str, Path]
+    :param destination: The file to create (must not exist)
+    :type destination: Union[str, Path]
+
+    :return: None
+    :rtype: None
+    """
+
+    # Open the source file
+    source_fd: int = os.open(
+        source,
+        os.O_RDONLY | getattr(os, "O_BINARY", 0),
+    )
+
+    try:
+        # Create the destination file (fails if it already exists)
+        destination_fd: int = os.open(
+            destination,
+            _COPY_FLAGS,
+            0o644,
+        )
+
+        try:
+            # Get the size of the source file
+            size: int = os.fstat(source_fd).st_size
+
+            # Check if the file is small enough to be copied in one go
+            if 0 < size < _SMALL_FILE_SIZE:
+                # Copy the content with one read and one write
+                _copy_small(
+                    source_fd=source_fd,
+                    destination_fd=destination_fd,
+                    size=size,
+                )
+            # Copy the content in-kernel where possible
+            elif not _copy_in_kernel(
+                source_fd=source_fd,
+                destination_fd=destination_fd,
+                size=size,
+            ):
+                # Fall back to copying through the per-thread buffer
+                _copy_buffered(
+                    source_fd=source_fd,
+                    destination_fd=destination_fd,
+                )
+        except BaseException:
+            # Remove the partially written destination
+            os.close(destination_fd)
+            os.unlink(destination)
+
+            raise
+
+        os.close(destination_fd)
+    finally:
+        os.close(source_fd)
+
+
+def _copy_tree_file(
+    source: str,
+    destination: str,
+) -> None:
+    """
+    Copies a single file of a directory tree, including its metadata
+
+    :param source: The file to copy
+    :type source: str
+    :param destination: The file to create (must not exist)
+    :type destination: str
+
+    :return: None
+    :rtype: None
+    """
+
+    # Copy the content of the file
+    _copy_file_contents(
+        source=source,
+        destination=destination,
+    )
+
+    # Copy the permission bits and timestamps like shutil.copytree does
+    shutil.copystat(
+        src=source,
+        dst=destination,
+    )
+
+
+def _raise_walk_error(exception: OSError) -> None:
+    """
+    Re-raises an error of os.walk, which would otherwise skip the directory it could not list
+
+    :param exception: The error raised while listing a directory
+    :type exception: OSError
+
+    :raises OSError: Always
+
+    :return: None
+    :rtype: None
+    """
+
+    raise exception
+
+
+def _copy_tree(
+    source: Path,
+    destination: Path,
+) -> None:
+    """
+    Copies a directory tree, copying the files in parallel
+
+    :param source: The directory to copy
+    :type source: Path
+    :param destination: The directory to create (must not exist)
+    :type destination: Path
+
+    :return: None
+    :rtype: None
+    """
+
+    # Initialize the list of (source, destination) directory pairs
+    directories: List[Tuple[str, str]] = []
+
+    # Initialize the list of (source, destination) file pairs
+    files: List[Tuple[str, str]] = []
+
+    for root, _, filenames in os.walk(
+        source,
+        followlinks=True,
+        onerror=_raise_walk_error,
+    ):
+        # Get the directory mirroring the current one in the destination
+        target: str = os.path.normpath(
+            os.path.join(
+                destination,
+                os.path.relpath(
+                    root,
+                    source,
+                ),
+            )
+        )
+
+        # Create the directory shell synchronously (parents are created first)
+        os.makedirs(target)
+
+        # Add the directory pair
+        directories.append((root, target))
+
+        # Add the file pairs of the current directory
+        files.extend(
+            (
+                os.path.join(
+                    root,
+                    filename,
+                ),
+                os.path.join(
+                    target,
+                    filename,
+                ),
+            )
+            for filename in filenames
+        )
+
+    # Copy the files in parallel to overlap their syscall latency
+    with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor:
+        futures = [
+            executor.submit(
+                _copy_tree_file,
+                file_source,
+                file_destination,
+            )
+            for (
+                file_source,
+                file_destination,
+            ) in files
+        ]
+
+    for future in futures:
+        # Re-raise the first error that occurred
+        future.result()
+
+    for (
+        directory_source,
+        directory_destination,
+    ) in reversed(directories):
+        # Copy the directory metadata once its content is complete
+        shutil.copystat(
+            src=directory_source,
+            dst=directory_destination,
+        )
+
+
+# The suffixes of the tar archives handled by tarfile (compression is detected on open)
+_TAR_SUFFIXES: Final[Tuple[str, ...]] = (
+    ".tar",
+    ".tar.bz2",
+    ".tar.gz",
+    ".tar.xz",
+    ".tbz2",
+    ".tgz",
+    ".txz",
+)
+
+
+def _zip_member_target(
+    root: str,
+    filename: str,
+) -> str:
+    """
+    Returns the path a zip member is extracted to, dropping absolute and parent components
+
+    :param root: The directory the archive is extracted to
+    :type root: str
+    :param filename: The name of the member inside the archive
+    :type filename: str
+
+    :return: The path to extract the member to
+    :rtype: str
+    """
+
+    # Normalize the separators of the member name
+    name: str = filename.replace(
+        "/",
+        os.path.sep,
+    )
+
+    # Check if the platform has an alternative separator
+    if os.path.altsep:
+        name = name.replace(
+            os.path.altsep,
+            os.path.sep,
+        )
+
+    # Return the path below the root, skipping drive, empty, "." and ".." components
+    return os.path.join(
+        root,
+        *(
+            part
+            for part in os.path.splitdrive(name)[1].split(os.path.sep)
+            if part not in ("", os.path.curdir, os.path.pardir)
+        ),
+    )
+
+
+def _extract_zip_member(
+    archive: zipfile.ZipFile,
+    lock: threading.Lock,
+    member: zipfile.ZipInfo,
+    target: str,
+) -> None:
+    """
+    Extracts a single zip member through the current thread's copy buffer
+
+    :param archive: The archive to extract the member from
+    :type archive: zipfile.ZipFile
+    :param lock: The lock serializing the opening and closing of members
+    :type lock: threading.Lock
+    :param member: The member to extract
+    :type member: zipfile.ZipInfo
+    :param target: The path to extract the member to
+    :type target: str
+
+    :return: None
+    :rtype: None
+    """
+
+    # Get this thread's copy buffer
+    view: memoryview = _copy_buffer()
+
+    # Open the member (ZipFile's reference counting is not thread-safe)
+    with lock:
+        source: zipfile.ZipExtFile = cast(
+            zipfile.ZipExtFile,
+            archive.open(member),
+        )
+
+    try:
+        with open(
+            target,
+            mode="wb",
+        ) as destination:
+            while True:
+                # Decompress the next chunk into the buffer
+                read = source.readinto(view)
+
+                # Check if the end of the member was reached
+                if not read:
+                    break
+
+                # Write the chunk
+                destination.write(view[:read])
+    finally:
+        # Close the member
+        with lock:
+            source.close()
+
+
+def _unpack_zip(
+    path: Path,
+    extract_to: Path,
+) -> None:
+    """
+    Extracts a zip archive, decompressing the members in parallel
+
+    :param path: The archive to extract
+    :type path: Path
+    :param extract_to: The directory to extract the archive to
+    :type extract_to: Path
+
+    :return: None
+    :rtype: None
+    """
+
+    # Get the directory to extract to as a string
+    root: str = os.fspath(extract_to)
+
+    # Initialize the lock serializing the opening and closing of members
+    lock: threading.Lock = threading.Lock()
+
+    with zipfile.ZipFile(path) as archive:
+        # Initialize the list of (member, target) pairs
+        members: List[Tuple[zipfile.ZipInfo, str]] = []
+
+        for member in archive.infolist():
+            # Get the path to extract the member to
+            target: str = _zip_member_target(
+                root=root,
+                filename=member.filename,
+            )
+
+            # Check if the member is a directory
+            if member.is_dir():
+                # Create the directory
+                os.makedirs(
+                    target,
+                    exist_ok=True,
+                )
+
+                continue
+
+            # Create the parent directories synchronously (avoids racing makedirs calls)
+            os.makedirs(
+                os.path.dirname(target),
+                exist_ok=True,
+            )
+
+            # Add the member
+            members.append((member, target))
+
+        # Decompress the members in parallel
+        with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor:
+            futures = [
+                executor.submit(
+                    _extract_zip_member,
+                    archive,
+                    lock,
+                    member,
+                    target,
+                )
+                for (
+                    member,
+                    target,
+                ) in members
+            ]
+
+        for future in futures:
+            # Re-raise the first error that occurred
+            future.result()
+
+
+def _unpack_tar(
+    path: Path,
+    extract_to: Path,
+) -> None:
+    """
+    Extracts a tar archive (optionally gzip, bzip2 or xz compressed)
+
+    :param path: The archive to extract
+    :type path: Path
+    :param extract_to: The directory to extract the archive to
+    :type extract_to: Path
+
+    :return: None
+    :rtype: None
+    """
+
+    # Open the archive (compressed tar streams can only be read sequentially)
+    with tarfile.open(path) as archive:
+        # Check if extraction filters are supported (Python 3.12+ and security backports)
+        if hasattr(tarfile, "data_filter"):
+            # Extract the archive, rejecting absolute paths, links outside the target and devices
+            archive.extractall(
+                extract_to,
+                filter="data",
+            )
+        else:
+            # Extract the archive
+            archive.extractall(extract_to)
+
+
+def _unpack_7z(
+    path: Path,
+    extract_to: Path,
+) -> bool:
+    """
+    Extracts a 7z archive in-process if the optional py7zr package is installed
+
+    :param path: The archive to extract
+    :type path: Path
+    :param extract_to: The directory to extract the archive to
+    :type extract_to: Path
+
+    :return: True if the archive was extracted, False if py7zr is not installed
+    :rtype: bool
+    """
+
+    try:
+        # Import the optional py7zr package lazily
+        import py7zr
+    except ImportError:
+        # Return False
+        return False
+
+    # Open and extract the archive
+    with py7zr.SevenZipFile(
+        mode="r",
+        file=path,
+    ) as archive:
+        archive.extractall(path=extract_to)
+
+    # Return True
+    return True
+
+
+def _lstat_kind(path: Union[str, Path]) -> Optional[str]:
+    """
+    Returns the kind of the path without following symlinks, using a single lstat call
+
+    :param path: The path to classify
+    :type path: Union[str, Path]
+
+    :return: "directory", "file" or "symlink", None if the path does not exist or is of another kind
+    :rtype: Optional[str]
+    """
+
+    try:
+        # Get the mode bits of the path itself
+        mode: int = os.lstat(path).st_mode
+    except (OSError, ValueError):
+        # Return None
+        return None
+
+    # Check if the path is a directory
+    if stat.S_ISDIR(mode):
+        return "directory"
+
+    # Check if the path is a symlink
+    if stat.S_ISLNK(mode):
+        return "symlink"
+
+    # Check if the path is a regular file
+    if stat.S_ISREG(mode):
+        return "file"
+
+    # Return None
+    return None
+
+
+def _followed_kind(
+    path: Union[str, Path],
+    kind: Optional[str],
+) -> Optional[str]:
+    """
+    Returns the kind of the path a symlink points to, leaving other kinds unchanged
+
+    :param path: The path that was classified
+    :type path: Union[str, Path]
+    :param kind: The kind returned by _lstat_kind for the path
+    :type kind: Optional[str]
+
+    :return: "directory" or "file" for a symlink to one, None for a dangling symlink, the kind otherwise
+    :rtype: Optional[str]
+    """
+
+    # Check if the path is a symlink
+    if kind != "symlink":
+        return kind
+
+    try:
+        # Get the mode bits of the symlink's target
+        mode: int = os.stat(path).st_mode
+    except (OSError, ValueError):
+        # Return None
+        return None
+
+    # Check if the target is a directory
+    if stat.S_ISDIR(mode):
+        return "directory"
+
+    # Check if the target is a regular file
+    if stat.S_ISREG(mode):
+        return "file"
+
+    # Return None
+    return None
+
+
+def _missing_argument(
+    argument: str,
+    source: Union[str, Path],
+    task: str,
+) -> bool:
+    """
+    Logs that a task of FileManager.open lacks a required argument
+
+    :param argument: The name of the missing argument
+    :type argument: str
+    :param source: The source path of the task
+    :type source: Union[str, Path]
+    :param task: The name of the task
+    :type task: str
+
+    :return: False
+    :rtype: bool
+    """
+
+    # Log the warning
+    logger.warning(
+        "Performing task '%s' on '%s' impossible: %s is required. Aborting...",
+        task,
+        source,
+        argument,
+    )
+
+    # Return False
+    return False
+
+
+def _open_copy(
+    cls: Type["FileManager"],
+    source: Union[str, Path],
+    kind: Optional[str],
+    target: Optional[Union[str, Path]] = None,
+    **_: Any,
+) -> bool:
+    """
+    Handles the "copy" task of FileManager.open
+
+    :param cls: The FileManager class
+    :type cls: Type["FileManager"]
+    :param source: The source path of the task
+    :type source: Union[str, Path]
+    :param kind: The kind of the source as returned by _lstat_kind
+    :type kind: Optional[str]
+    :param target: The path to copy the source to
+    :type target: Optional[Union[str, Path]]
+    :param _: The arguments of the other tasks (ignored)
+    :type _: Any
+
+    :return: True if the source was copied, False otherwise
+    :rtype: bool
+    """
+
+    # Check if the target is given
+    if target is None:
+        # Log the warning and return False
+        return _missing_argument(
+            argument="target",
+            source=source,
+            task="copy",
+        )
+
+    # Follow a symlink to pick the variant matching its target
+    kind = _followed_kind(
+        kind=kind,
+        path=source,
+    )
+
+    # Copy the directory or the file
+    return (
+        cls.copy_directory(
+            source=source,
+            destination=target,
+        )
+        if kind == "directory"
+        else cls.copy_file(
+            source=source,
+            destination=target,
+        )
+    )
+
+
+def _open_create(
+    cls: Type["FileManager"],
+    source: Union[str, Path],
+    kind: Optional[str],
+    **_: Any,
+) -> bool:
+    """
+    Handles the "create" task of FileManager.open
+
+    Note: Only str sources can request a directory (e.g. "new_dir/"),
+    Path objects drop the trailing separator
+
+    :param cls: The FileManager class
+    :type cls: Type["FileManager"]
+    :param source: The source path of the task
+    :type source: Union[str, Path]
+    :param kind: The kind of the source as returned by _lstat_kind
+    :type kind: Optional[str]
+    :param _: The arguments of the other tasks (ignored)
+    :type _: Any
+
+    :return: True if the source was created, False otherwise
+    :rtype: bool
+    """
+
+    # Check if something already exists at the source
+    if kind is not None:
+        # Log the warning
+        logger.warning(
+            "Creating %s at '%s' impossible: %s already exists. Aborting...",
+            kind,
+            source,
+            kind,
+        )
+
+        # Return False
+        return False
+
+    # Create a directory for a trailing separator (str only), a file otherwise
+    return (
+        cls.create_directory(path=source)
+        if os.fspath(source).endswith(("/", os.sep))
+        else cls.create_file(path=source)
+    )
+
+
+def _open_delete(
+    cls: Type["FileManager"],
+    source: Union[str, Path],
+    kind: Optional[str],
+    **_: Any,
+) -> bool:
+    """
+    Handles the "delete" task of FileManager.open
+
+    :param cls: The FileManager class
+    :type cls: Type["FileManager"]
+    :param source: The source path of the task
+    :type source: Union[str, Path]
+    :param kind: The kind of the source as returned by _lstat_kind
+    :type kind: Optional[str]
+    :param _: The arguments of the other tasks (ignored)
+    :type _: Any
+
+    :return: True if the source was deleted, False otherwise
+    :rtype: bool
+    """
+
+    # Delete the directory, the file or the symlink
+    if kind == "directory":
+        return cls.delete_directory(path=source)
+
+    if kind == "file":
+        return cls.delete_file(path=source)
+
+    return cls.delete_symlink(path=source)
+
+
+def _open_empty(
+    cls: Type["FileManager"],
+    source: Union[str, Path],
+    kind: Optional[str],
+    **_: Any,
+) -> bool:
+    """
+    Handles the "empty" task of FileManager.open
+
+    :param cls: The FileManager class
+    :type cls: Type["FileManager"]
+    :param source: The source path of the task
+    :type source: Union[str, Path]
+    :param kind: The kind of the source as returned by _lstat_kind
+    :type kind: Optional[str]
+    :param _: The arguments of the other tasks (ignored)
+    :type _: Any
+
+    :return: True if the source is empty, False otherwise
+    :rtype: bool
+    """
+
+    # Follow a symlink to pick the variant matching its target
+    kind = _followed_kind(
+        kind=kind,
+        path=source,
+    )
+
+    # Check the directory or the file
+    return (
+        cls.is_directory_empty(source)
+        if kind == "directory"
+        else cls.is_file_empty(source)
+    )
+
+
+def _open_exists(
+    cls: Type["FileManager"],
+    source: Union[str, Path],
+    kind: Optional[str],
+    **_: Any,
+) -> bool:
+    """
+    Handles the "exists" task of FileManager.open
+
+    :param cls: The FileManager class
+    :type cls: Type["FileManager"]
+    :param source: The source path of the task
+    :type source: Union[str, Path]
+    :param kind: The kind of the source as returned by _lstat_kind
+    :type kind: Optional[str]
+    :param _: The arguments of the other tasks (ignored)
+    :type _: Any
+
+    :return: True if the source exists, False otherwise
+    :rtype: bool
+    """
+
+    # Return whether the lstat call found the source
+    return kind is not None
+
+
+def _open_link(
+    cls: Type["FileManager"],
+    source: Union[str, Path],
+    kind: Optional[str],
+    target: Optional[Union[str, Path]] = None,
+    **_: Any,
+) -> bool:
+    """
+    Handles the "link" task of FileManager.open
+
+    :param cls: The FileManager class
+    :type cls: Type["FileManager"]
+    :param source: The source path of the task
+    :type source: Union[str, Path]
+    :param kind: The kind of the source as returned by _lstat_kind
+    :type kind: Optional[str]
+    :param target: The path of the symlink to create
+    :type target: Optional[Union[str, Path]]
+    :param _: The arguments of the other tasks (ignored)
+    :type _: Any
+
+    :return: True if the symlink was created, False otherwise
+    :rtype: bool
+    """
+
+    # Check if the target is given
+    if target is None:
+        # Log the warning and return False
+        return _missing_argument(
+            argument="target",
+            source=source,
+            task="link",
+        )
+
+    # Create the symlink
+    return cls.create_symlink(
+        source=source,
+        target=target,
+    )
+
+
+def _open_move(
+    cls: Type["FileManager"],
+    source: Union[str, Path],
+    kind: Optional[str],
+    target: Optional[Union[str, Path]] = None,
+    **_: Any,
+) -> bool:
+    """
+    Handles the "move" task of FileManager.open
+
+    :param cls: The FileManager class
+    :type cls: Type["FileManager"]
+    :param source: The source path of the task
+    :type source: Union[str, Path]
+    :param kind: The kind of the source as returned by _lstat_kind
+    :type kind: Optional[str]
+    :param target: The path to move the source to
+    :type target: Optional[Union[str, Path]]
+    :param _: The arguments of the other tasks (ignored)
+    :type _: Any
+
+    :return: True if the source was moved, False otherwise
+    :rtype: bool
+    """
+
+    # Check if the target is given
+    if target is None:
+        # Log the warning and return False
+        return _missing_argument(
+            argument="target",
+            source=source,
+            task="move",
+        )
+
+    # Follow a symlink to pick the variant matching its target
+    kind = _followed_kind(
+        kind=kind,
+        path=source,
+    )
+
+    # Move the directory or the file
+    return (
+        cls.move_directory(
+            path=source,
+            destination=target,
+        )
+        if kind == "directory"
+        else cls.move_file(
+            path=source,
+            destination=target,
+        )
+    )
+
+
+def _open_read(
+    cls: Type["FileManager"],
+    source: Union[str, Path],
+    kind: Optional[str],
+    **_: Any,
+) -> Optional[str]:
+    """
+    Handles the "read" task of FileManager.open
+
+    :param cls: The FileManager class
+    :type cls: Type["FileManager"]
+    :param source: The source path of the task
+    :type source: Union[str, Path]
+    :param kind: The kind of the source as returned by _lstat_kind
+    :type kind: Optional[str]
+    :param _: The arguments of the other tasks (ignored)
+    :type _: Any
+
+    :return: The content of the file if it was read, None otherwise
+    :rtype: Optional[str]
+    """
+
+    # Read the file
+    return cls.read_file(path=source)
+
+
+def _open_rename(
+    cls: Type["FileManager"],
+    source: Union[str, Path],
+    kind: Optional[str],
+    new_name: Optional[str] = None,
+    **_: Any,
+) -> bool:
+    """
+    Handles the "rename" task of FileManager.open
+
+    :param cls: The FileManager class
+    :type cls: Type["FileManager"]
+    :param source: The source path of the task
+    :type source: Union[str, Path]
+    :param kind: The kind of the source as returned by _lstat_kind
+    :type kind: Optional[str]
+    :param new_name: The new name of the source
+    :type new_name: Optional[str]
+    :param _: The arguments of the other tasks (ignored)
+    :type _: Any
+
+    :return: True if the source was renamed, False otherwise
+    :rtype: bool
+    """
+
+    # Check if the new name is given
+    if new_name is None:
+        # Log the warning and return False
+        return _missing_argument(
+            argument="new_name",
+            source=source,
+            task="rename",
+        )
+
+    # Rename the directory, the file or the symlink
+    if kind == "directory":
+        return cls.rename_directory(
+            path=source,
+            new_name=new_name,
+        )
+
+    if kind == "file":
+        return cls.rename_file(
+            path=source,
+            new_name=new_name,
+        )
+
+    return cls.rename_symlink(
+        path=source,
+        new_name=new_name,
+    )
+
+
+def _open_unpack(
+    cls: Type["FileManager"],
+    source: Union[str, Path],
+    kind: Optional[str],
+    target: Optional[Union[str, Path]] = None,
+    **_: Any,
+) -> bool:
+    """
+    Handles the "unpack" task of FileManager.open
+
+    :param cls: The FileManager class
+    :type cls: Type["FileManager"]
+    :param source: The source path of the task
+    :type source: Union[str, Path]
+    :param kind: The kind of the source as returned by _lstat_kind
+    :type kind: Optional[str]
+    :param target: The directory to extract the archive to
+    :type target: Optional[Union[str, Path]]
+    :param _: The arguments of the other tasks (ignored)
+    :type _: Any
+
+    :return: True if the archive was unpacked, False otherwise
+    :rtype: bool
+    """
+
+    # Check if the target is given
+    if target is None:
+        # Log the warning and return False
+        return _missing_argument(
+            argument="target",
+            source=source,
+            task="unpack",
+        )
+
+    # Unpack the archive
+    return cls.unpack_archive(
+        path=source,
+        extract_to=target,
+    )
+
+
+def _open_write(
+    cls: Type["FileManager"],
+    source: Union[str, Path],
+    kind: Optional[str],
+    content: Optional[str] = None,
+    **_: Any,
+) -> bool:
+    """
+    Handles the "write" task of FileManager.open
+
+    :param cls: The FileManager class
+    :type cls: Type["FileManager"]
+    :param source: The source path of the task
+    :type source: Union[str, Path]
+    :param kind: The kind of the source as returned by _lstat_kind
+    :type kind: Optional[str]
+    :param content: The content to write to the file
+    :type content: Optional[str]
+    :param _: The arguments of the other tasks (ignored)
+    :type _: Any
+
+    :return: True if the content was written, False otherwise
+    :rtype: bool
+    """
+
+    # Check if the content is given
+    if content is None:
+        # Log the warning and return False
+        return _missing_argument(
+            argument="content",
+            source=source,
+            task="write",
+        )
+
+    # Write the content to the file
+    return cls.write_file(
+        path=source,
+        content=content,
+    )
+
+
+# The handlers of FileManager.open, keyed by their FileTask
+_DISPATCH: Final[Dict[FileTask, Callable[..., Optional[Union[bool, str]]]]] = {
+    FileTask.COPY: _open_copy,
+    FileTask.CREATE: _open_create,
+    FileTask.DELETE: _open_delete,
+    FileTask.EXISTS: _open_exists,
+    FileTask.EMPTY: _open_empty,
+    FileTask.LINK: _open_link,
+    FileTask.MOVE: _open_move,
+    FileTask.READ: _open_read,
+    FileTask.RENAME: _open_rename,
+    FileTask.UNPACK: _open_unpack,
+    FileTask.WRITE: _open_write,
+}
+
+
+# The errors expected from file operations, logged without a traceback
+_EXPECTED_ERRORS: Final[Tuple[Type[OSError], ...]] = (
+    FileExistsError,
+    FileNotFoundError,
+    IsADirectoryError,
+    NotADirectoryError,
+    PermissionError,
+)
+
+
+# Whether the module runs on Windows (resolved once at import time)
+_IS_WINDOWS: Final[bool] = sys.platform == "win32"
+
+
+def _symlink_posix(
+    source: Path,
+    target: Path,
+) -> None:
+    """
+    Creates a symlink at the target path pointing to the source path on POSIX systems
+
+    :param source: The path the symlink points to
+    :type source: Path
+    :param target: The path to create the symlink at
+    :type target: Path
+
+    :return: None
+    :rtype: None
+    """
+
+    # Create the symlink (target_is_directory is ignored on POSIX, so skip the stat)
+    target.symlink_to(target=source)
+
+
+def _symlink_windows(
+    source: Path,
+    target: Path,
+) -> None:
+    """
+    Creates a symlink at the target path pointing to the source path on Windows
+
+    :param source: The path the symlink points to
+    :type source: Path
+    :param target: The path to create the symlink at
+    :type target: Path
+
+    :return: None
+    :rtype: None
+    """
+
+    # Create the symlink (Windows needs to know whether it points to a directory)
+    os.symlink(
+        src=source,
+        dst=target,
+        target_is_directory=source.is_dir(),
+    )
+
+
+# The symlink implementation for the current platform
+_symlink: Final[Callable[..., None]] = (
+    _symlink_windows if _IS_WINDOWS else _symlink_posix
+)
+
+
+# The flags used to open a directory for fsync (O_DIRECTORY does not exist on Windows)
+_DIRECTORY_FLAGS: Final[int] = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+
+
+def _fsync_directory(path: str) -> None:
     """
-    The FileTask enum is an enum that represents the different file operations.
+    Flushes the entries of a directory to disk
 
-    Attributes:
-    ----------
-    COPY: Copy a file
-    CREATE: Create a file
-    DELETE: Delete a file
-    EXISTS: Check if a file or directory exists
-    LINK: Create a symlink
-    MOVE: Move a file
-    READ: Read a file
-    RENAME: Rename a file
-    UNPACK: Unpack an archive
-    WRITE: Write to a file
+    :param path: The directory to flush
+    :type path: str
+
+    :return: None
+    :rtype: None
+
+    Note: Windows cannot open directories, so this is a no-op there
     """
 
-    COPY = "copy"
-    CREATE = "create"
-    DELETE = "delete"
-    EXISTS = "exists"
-    LINK = "link"
-    MOVE = "move"
-    READ = "read"
-    RENAME = "rename"
-    UNPACK = "unpack"
-    WRITE = "write"
+    # Check if the platform supports opening directories
+    if _IS_WINDOWS:
+        return
 
-    def __str__(self) -> str:
-        """
-        Returns the string representation of the enum member.
+    # Open the directory
+    fd: int = os.open(
+        path,
+        _DIRECTORY_FLAGS,
+    )
+
+    try:
+        # Flush the directory entries (renames, creations, removals) to disk
+        os.fsync(fd)
+    finally:
+        # Close the directory
+        os.close(fd)
+
+
+# The renameat2 flag that makes the rename fail if the destination exists
+_RENAME_NOREPLACE: Final[int] = 1
+
+# The directory file descriptor that makes renameat2 resolve paths like rename
+_AT_FDCWD: Final[int] = -100
+
+
+def _load_renameat2() -> Optional[Callable[..., int]]:
+    """
+    Loads the renameat2 function of the C library
+
+    :return: The renameat2 function, None if the platform or the C library lacks it
+    :rtype: Optional[Callable[..., int]]
+    """
+
+    # Check if the platform is Linux
+    if sys.platform != "linux":
+        # Return None
+        return None
+
+    try:
+        # Get the function from the C library the interpreter is linked against (glibc 2.28+)
+        function = ctypes.CDLL(
+            None,
+            use_errno=True,
+        ).renameat2
+    except (AttributeError, OSError):
+        # Return None
+        return None
+
+    # Declare the signature of the function
+    function.argtypes = (
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_uint,
+    )
+    function.restype = ctypes.c_int
+
+    # Return the function
+    return function
+
+
+# The renameat2 function (resolved once at import time)
+_RENAMEAT2: Final[Optional[Callable[..., int]]] = _load_renameat2()
+
+
+def _rename_noreplace(
+    source: Union[str, Path],
+    destination: Union[str, Path],
+) -> None:
+    """
+    Renames a path, failing if the destination already exists
+
+    :param source: The path to rename
+    :type source: Union[str, Path]
+    :param destination: The new path
+    :type destination: Union[str, Path]
+
+    :raises FileExistsError: If the destination already exists
+    :raises FileNotFoundError: If the source does not exist
+
+    :return: None
+    :rtype: None
+
+    Note: On Linux the check and the rename are a single atomic renameat2(RENAME_NOREPLACE) call,
+    on Windows os.rename never replaces, elsewhere the destination is checked first
+    """
+
+    # Check if renameat2 is available
+    if _RENAMEAT2 is not None:
+        # Encode the paths for the C call
+        encoded_source: bytes = os.fsencode(source)
+        encoded_destination: bytes = os.fsencode(destination)
+
+        # Check if a path contains a null byte (C would silently truncate it)
+        if b"\0" in encoded_source or b"\0" in encoded_destination:
+            raise ValueError("embedded null byte")
+
+        # Check if the rename succeeded
+        if (
+            _RENAMEAT2(
+                _AT_FDCWD,
+                encoded_source,
+                _AT_FDCWD,
+                encoded_destination,
+                _RENAME_NOREPLACE,
+            )
+            == 0
+        ):
+            return
+
+        # Get the error number of the failed call
+        error: int = ctypes.get_errno()
+
+        # Check if the filesystem supports the flag (EINVAL otherwise, ENOSYS on old kernels)
+        if error not in (errno.EINVAL, errno.ENOSYS):
+            # Raise the matching OSError subclass
+            raise OSError(
+                error,
+                os.strerror(error),
+                os.fspath(source),
+                None,
+                os.fspath(destination),
+            )
+
+    # Check if the destination exists (os.rename replaces it on POSIX)
+    if not _IS_WINDOWS and os.path.lexists(destination):
+        # Raise a FileExistsError like renameat2 would
+        raise FileExistsError(
+            errno.EEXIST,
+            os.strerror(errno.EEXIST),
+            os.fspath(source),
+            None,
+            os.fspath(destination),
+        )
+
+    # Rename the path
+    os.rename(
+        source,
+        destination,
+    )
+
+
+def _rmtree(path: Union[str, Path]) -> None:
+    """
+    Removes a directory tree, classifying the entries without a stat call per entry
+
+    :param path: The directory to remove
+    :type path: Union[str, Path]
+
+    :return: None
+    :rtype: None
+    """
+
+    # Check if the path is a symlink (os.scandir would list the directory it points to)
+    if os.path.islink(path):
+        raise NotADirectoryError(
+            errno.ENOTDIR,
+            "Cannot remove a tree through a symlink",
+            os.fspath(path),
+        )
+
+    # Initialize the list of directories to remove once they are emptied
+    directories: List[str] = [os.fspath(path)]
+
+    # Initialize the stack of directories whose entries still have to be removed
+    pending: List[str] = [directories[0]]
+
+    while pending:
+        with os.scandir(pending.pop()) as iterator:
+            for entry in iterator:
+                # Check if the entry is a directory (d_type from readdir, no stat on Linux)
+                if entry.is_dir(follow_symlinks=False):
+                    # Add the directory to the directories to empty and remove
+                    directories.append(entry.path)
+                    pending.append(entry.path)
+                # Check if the entry is a directory symlink or junction on Windows
+                elif _IS_WINDOWS and entry.is_dir():
+                    # Remove the link itself (Windows removes these with rmdir)
+                    os.rmdir(entry.path)
+                else:
+                    # Remove the file or symlink
+                    os.unlink(entry.path)
+
+    # Remove the emptied directories, deepest first (children follow their parents)
+    for directory in reversed(directories):
+        os.rmdir(directory)
+
+
+def _move_tree(
+    source: Path,
+    destination: Path,
+) -> None:
+    """
+    Moves a directory tree, copying it when the destination is on another filesystem
+
+    :param source: The directory to move
+    :type source: Path
+    :param destination: The new path of the directory (must not exist)
+    :type destination: Path
+
+    :return: None
+    :rtype: None
+    """
+
+    try:
+        # Move the directory with a single rename
+        _rename_noreplace(
+            destination=destination,
+            source=source,
+        )
+    except OSError as exception:
+        # Check if the rename failed because it crosses filesystems
+        if exception.errno != errno.EXDEV:
+            raise
+
+        # Check if the source is a symlink (the link moves, not the tree it points to)
+        if os.path.islink(source):
+            # Recreate the link on the other filesystem (fails if the destination exists)
+            os.symlink(
+                os.readlink(source),
+                destination,
+                target_is_directory=True,
+            )
+
+            # Remove the source link
+            os.unlink(source)
+
+            return
+
+        # Copy the tree to the other filesystem (fails if the destination exists)
+        shutil.copytree(
+            copy_function=_copy_tree_file,
+            dst=destination,
+            src=source,
+            symlinks=True,
+        )
+
+        # Remove the source tree
+        _rmtree(path=source)
 
-        :return: The string representation of the enum member
-        :rtype: str
-        """
 
-        # Return the string representation of the enum member
-        return self.value
+def _read_bytes(path: Path) -> Optional[bytes]:
+    """
+    Reads the raw content of a file at the given path
+
+    :param path: The path to read the file at
+    :type path: Path
+
+    :return: The content of the file if it was read, None otherwise
+    :rtype: Optional[bytes]
+    """
+
+    try:
+        # Return the content of the file
+        return path.read_bytes()
+    except OSError:
+        # Return None
+        return None
+
+
+def _read_text(path: Path) -> str:
+    """
+    Reads the content of a file at the given path in a single call
+
+    :param path: The path to read the file at
+    :type path: Path
+
+    :return: The content of the file
+    :rtype: str
+    """
+
+    # Read the raw bytes into a buffer sized from fstat and decode them in one go
+    return path.read_bytes().decode("utf-8")
+
+
+# The flags used to open an existing file for writing (O_BINARY only exists on Windows)
+_WRITE_FLAGS: Final[int] = os.O_WRONLY | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_text(
+    path: Path,
+    content: str,
+) -> None:
+    """
+    Writes content to an existing file at the given path in a single call
+
+    :param path: The path to write the content to
+    :type path: Path
+    :param content: The content to write to the file
+    :type content: str
+
+    :raises FileNotFoundError: If the file does not exist (O_CREAT is not passed)
+
+    :return: None
+    :rtype: None
+    """
+
+    # Encode the content up front
+    data: memoryview = memoryview(content.encode("utf-8"))
+
+    # Open and truncate the file, which fails if it does not exist
+    fd: int = os.open(
+        path,
+        _WRITE_FLAGS,
+    )
+
+    try:
+        while data:
+            # Write the remaining content (os.write may write less than asked)
+            data = data[
+                os.write(
+                    fd,
+                    data,
+                ) :
+            ]
+    finally:
+        # Close the file
+        os.close(fd)
 
 
 class FileManager:
@@ -79,6 +1820,7 @@ class FileManager:
     ask_and_save_file: Asks the user to save a file
     create_directory: Creates a directory at the given path
     create_file: Creates a file at the given path
+    create_files: Creates files at the given paths
     create_symlink: Creates a symlink at the given path
     delete_directory: Deletes a directory at the given path
     delete_file: Deletes a file at the given path
@@ -93,124 +1835,116 @@ class FileManager:
     rename_file: Renames a file at the given path
     rename_symlink: Renames a symlink at the given path
     read_file: Reads a file at the given path
+    read_file_async: Reads a file at the given path without blocking the event loop
+    read_files_uring: Reads files at the given paths, batched through io_uring where available
     unpack_archive: Unpacks an archive at the given path
     write_file: Writes content to a file at the given path
+    write_file_async: Writes content to a file at the given path without blocking the event loop
+    write_files: Writes content to files at the given paths
     """
 
     # Initialize the current working directory
     CWD: Final[Path] = Path(os.getcwd())
 
+    # The class is a namespace and is never instantiated
+    __slots__ = ()
+
     # Initialize the OS
     OS: Final[str] = sys.platform
 
-    @classmethod
-    def _convert_to_path(
-        cls,
-        path: Union[str, Path],
-    ) -> Path:
-        """
-        Converts the given path to a Path object
-
-        :param path: The path to convert
-        :type path: Union[str, Path]
-
-        :return: The converted path
-        :rtype: Path
-        """
-
-        # Check if the path is a Path object
-        if not isinstance(
-            path,
-            Path,
-        ):
-            # Convert the path to a Path object
-            path = Path(path)
-
-        # Return the path
-        return path
+    # Bind the module-level path conversion helper (no descriptor binding of cls)
+    _convert_to_path = staticmethod(_to_path)
 
     @classmethod
-    def ask_and_open_directory(
+    def _ask(
         cls,
-        title: str,
+        dialog: Callable[..., _DialogResult],
+        operation: str,
         initialdir: Optional[Union[str, Path]] = None,
-    ) -> Optional[str]:
+        initialfile: Optional[Union[str, Path]] = None,
+        **options: Any,
+    ) -> Optional[_DialogResult]:
         """
-        Asks the user to open a directory
+        Validates the initial paths and shows the given file dialog
 
-        :param title: The title of the directory dialog
-        :type title: str
-        :param initialdir: The initial directory to open the directory dialog at
+        :param dialog: The filedialog function to call
+        :type dialog: Callable[..., _DialogResult]
+        :param operation: The operation shown in log messages (e.g. "Opening file")
+        :type operation: str
+        :param initialdir: The initial directory to open the dialog at
         :type initialdir: Optional[Union[str, Path]]
+        :param initialfile: The initial file to open the dialog at
+        :type initialfile: Optional[Union[str, Path]]
+        :param options: The remaining options passed to the dialog
+        :type options: Any
 
-        :return: The path to the directory if the user opened it, None otherwise
-        :rtype: Optional[str]
+        :return: The result of the dialog, None if the initial paths are invalid or the dialog failed
+        :rtype: Optional[_DialogResult]
         """
 
-        # Check if the initial directory has been passed
-        if initialdir:
-            # Convert the initial directory to a Path object
-            initialdir = cls._convert_to_path(path=initialdir)
-
-            # Check if the initial directory exists
-            if not cls.does_directory_exist(path=initialdir):
-                # Log the warning
-                print(
-                    f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Opening directory at '{initialdir.resolve()}' impossible: directory does not exist. Aborting..."
-                )
+        # Validate the initial directory and file
+        paths = cls._validate_dialog_paths(
+            operation=operation,
+            initialdir=initialdir,
+            initialfile=initialfile,
+        )
 
-                # Return None
-                return None
+        # Check if the initial directory or file is invalid
+        if paths is None:
+            # Return None
+            return None
 
         try:
-            # Ask the user to open a directory
-            return filedialog.askdirectory(
-                initialdir=initialdir,
-                title=title,
+            # Show the dialog (tkinter drops options that are None)
+            return dialog(
+                initialdir=paths[0],
+                initialfile=paths[1],
+                **options,
             )
         except Exception:
-            # Print the error
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to open directory at '{initialdir.resolve()}':\n{traceback.format_exc()}"
+            # Log the error along with its traceback
+            logger.exception(
+                "Caught an exception while %s at '%s'",
+                operation.lower(),
+                paths[1] or paths[0],
             )
 
             # Return None
             return None
 
     @classmethod
-    def ask_and_open_file(
+    def _validate_dialog_paths(
         cls,
-        title: str,
-        filetypes: List[Tuple[str, str]],
+        operation: str,
         initialdir: Optional[Union[str, Path]] = None,
         initialfile: Optional[Union[str, Path]] = None,
-    ) -> Optional[str]:
+    ) -> Optional[Tuple[Optional[Path], Optional[Path]]]:
         """
-        Asks the user to open a file
+        Converts and validates the initial directory and file of a file dialog
 
-        :param title: The title of the file dialog
-        :type title: str
-        :param filetypes: The file types to filter by
-        :type filetypes: List[Tuple[str, str]]
-        :param initialdir: The initial directory to open the file dialog at
+        :param operation: The operation shown in log messages (e.g. "Opening file")
+        :type operation: str
+        :param initialdir: The initial directory to open the dialog at
         :type initialdir: Optional[Union[str, Path]]
-        :param initialfile: The initial file to open the file dialog at
+        :param initialfile: The initial file to open the dialog at
         :type initialfile: Optional[Union[str, Path]]
 
-        :return: The path to the file if the user opened it, None otherwise
-        :rtype: Optional[str]
+        :return: The converted initial directory and file, None if either does not exist
+        :rtype: Optional[Tuple[Optional[Path], Optional[Path]]]
         """
 
         # Check if the initial directory has been passed
         if initialdir:
             # Convert the initial directory to a Path object
-            initialdir = cls._convert_to_path(path=initialdir)
+            initialdir = _to_path(initialdir)
 
             # Check if the initial directory exists
-            if not cls.does_directory_exist(path=initialdir):
+            if not _is_dir(initialdir):
                 # Log the warning
-                print(
-                    f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Opening file at '{initialdir.resolve()}' impossible: directory does not exist. Aborting..."
+                logger.warning(
+                    "%s at '%s' impossible: directory does not exist. Aborting...",
+                    operation,
+                    initialdir,
                 )
 
                 # Return None
@@ -219,45 +1953,62 @@ class FileManager:
         # Check if the initial file has been passed
         if initialfile:
             # Convert the initial file to a Path object
-            initialfile = cls._convert_to_path(path=initialfile)
+            initialfile = _to_path(initialfile)
 
             # Check if the initial file exists
-            if not cls.does_file_exist(path=initialfile):
+            if not _is_file(initialfile):
                 # Log the warning
-                print(
-                    f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Opening file at '{initialfile.resolve()}' impossible: file does not exist. Aborting..."
+                logger.warning(
+                    "%s at '%s' impossible: file does not exist. Aborting...",
+                    operation,
+                    initialfile,
                 )
 
                 # Return None
                 return None
 
-        try:
-            # Ask the user to open a file
-            return filedialog.askopenfilename(
-                filetypes=filetypes,
-                initialdir=initialdir,
-                initialfile=initialfile,
-                title=title,
-            )
-        except Exception:
-            # Print the error
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to open file at '{initialfile.resolve()}':\n{traceback.format_exc()}"
-            )
+        # Return the converted initial directory and file
+        return (
+            initialdir or None,
+            initialfile or None,
+        )
 
-            # Return None
-            return None
+    @classmethod
+    def ask_and_open_directory(
+        cls,
+        title: str,
+        initialdir: Optional[Union[str, Path]] = None,
+    ) -> Optional[str]:
+        """
+        Asks the user to open a directory
+
+        :param title: The title of the directory dialog
+        :type title: str
+        :param initialdir: The initial directory to open the directory dialog at
+        :type initialdir: Optional[Union[str, Path]]
+
+        :return: The path to the directory if the user opened it, None otherwise
+        :rtype: Optional[str]
+        """
+
+        # Ask the user to open a directory
+        return cls._ask(
+            dialog=filedialog.askdirectory,
+            operation="Opening directory",
+            initialdir=initialdir,
+            title=title,
+        )
 
     @classmethod
-    def ask_and_open_files(
+    def ask_and_open_file(
         cls,
         title: str,
         filetypes: List[Tuple[str, str]],
         initialdir: Optional[Union[str, Path]] = None,
         initialfile: Optional[Union[str, Path]] = None,
-    ) -> Optional[Union[Tuple[str, ...], str]]:
+    ) -> Optional[str]:
         """
-        Asks the user to open files
+        Asks the user to open a file
 
         :param title: The title of the file dialog
         :type title: str
@@ -268,67 +2019,30 @@ class FileManager:
         :param initialfile: The initial file to open the file dialog at
         :type initialfile: Optional[Union[str, Path]]
 
-        :return: The paths to the files if the user opened them, None otherwise
-        :rtype: Optional[Union[Tuple[str, ...], str]]
+        :return: The path to the file if the user opened it, None otherwise
+        :rtype: Optional[str]
         """
 
-        # Check if the initial directory has been passed
-        if initialdir:
-            # Convert the initial directory to a Path object
-            initialdir = cls._convert_to_path(path=initialdir)
-
-            # Check if the initial directory exists
-            if not cls.does_directory_exist(path=initialdir):
-                # Log the warning
-                print(
-                    f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Opening files at '{initialdir.resolve()}' impossible: directory does not exist. Aborting..."
-                )
-
-                # Return None
-                return None
-
-        # Check if the initial file has been passed
-        if initialfile:
-            # Convert the initial file to a Path object
-            initialfile = cls._convert_to_path(path=initialfile)
-
-            # Check if the initial file exists
-            if not cls.does_file_exist(path=initialfile):
-                # Log the warning
-                print(
-                    f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Opening files at '{initialfile.resolve()}' impossible: file does not exist. Aborting..."
-                )
-
-                # Return None
-                return None
-
-        try:
-            # Ask the user to open files
-            return filedialog.askopenfilenames(
-                filetypes=filetypes,
-                initialdir=initialdir,
-                initialfile=initialfile,
-                title=title,
-            )
-        except Exception:
-            # Print the error
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to open files at '{initialfile.resolve()}':\n{traceback.format_exc()}"
-            )
-
-            # Return None
-            return None
+        # Ask the user to open a file
+        return cls._ask(
+            dialog=filedialog.askopenfilename,
+            operation="Opening file",
+            filetypes=filetypes,
+            initialdir=initialdir,
+            initialfile=initialfile,
+            title=title,
+        )
 
     @classmethod
-    def ask_and_open_file_name(
+    def ask_and_open_files(
         cls,
         title: str,
         filetypes: List[Tuple[str, str]],
         initialdir: Optional[Union[str, Path]] = None,
         initialfile: Optional[Union[str, Path]] = None,
-    ) -> Optional[str]:
+    ) -> Optional[Union[Tuple[str, ...], str]]:
         """
-        Asks the user to open a file name
+        Asks the user to open files
 
         :param title: The title of the file dialog
         :type title: str
@@ -339,56 +2053,53 @@ class FileManager:
         :param initialfile: The initial file to open the file dialog at
         :type initialfile: Optional[Union[str, Path]]
 
-        :return: The path to the file if the user opened it, None otherwise
-        :rtype: Optional[str]
+        :return: The paths to the files if the user opened them, None otherwise
+        :rtype: Optional[Union[Tuple[str, ...], str]]
         """
 
-        # Check if the initial directory has been passed
-        if initialdir:
-            # Convert the initial directory to a Path object
-            initialdir = cls._convert_to_path(path=initialdir)
-
-            # Check if the initial directory exists
-            if not cls.does_directory_exist(path=initialdir):
-                # Log the warning
-                print(
-                    f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Opening file name at '{initialdir.resolve()}' impossible: directory does not exist. Aborting..."
-                )
-
-                # Return None
-                return None
-
-        # Check if the initial file has been passed
-        if initialfile:
-            # Convert the initial file to a Path object
-            initialfile = cls._convert_to_path(path=initialfile)
+        # Ask the user to open files
+        return cls._ask(
+            dialog=filedialog.askopenfilenames,
+            operation="Opening files",
+            filetypes=filetypes,
+            initialdir=initialdir,
+            initialfile=initialfile,
+            title=title,
+        )
 
-            # Check if the initial file exists
-            if not cls.does_file_exist(path=initialfile):
-                # Log the warning
-                print(
-                    f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Opening file name at '{initialfile.resolve()}' impossible: file does not exist. Aborting..."
-                )
+    @classmethod
+    def ask_and_open_file_name(
+        cls,
+        title: str,
+        filetypes: List[Tuple[str, str]],
+        initialdir: Optional[Union[str, Path]] = None,
+        initialfile: Optional[Union[str, Path]] = None,
+    ) -> Optional[str]:
+        """
+        Asks the user to open a file name
 
-                # Return None
-                return None
+        :param title: The title of the file dialog
+        :type title: str
+        :param filetypes: The file types to filter by
+        :type filetypes: List[Tuple[str, str]]
+        :param initialdir: The initial directory to open the file dialog at
+        :type initialdir: Optional[Union[str, Path]]
+        :param initialfile: The initial file to open the file dialog at
+        :type initialfile: Optional[Union[str, Path]]
 
-        try:
-            # Ask the user to open a file name
-            return filedialog.askopenfilename(
-                filetypes=filetypes,
-                initialdir=initialdir,
-                initialfile=initialfile,
-                title=title,
-            )
-        except Exception:
-            # Print the error
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to open file name at '{initialfile.resolve()}':\n{traceback.format_exc()}"
-            )
+        :return: The path to the file if the user opened it, None otherwise
+        :rtype: Optional[str]
+        """
 
-            # Return None
-            return None
+        # Ask the user to open a file name
+        return cls._ask(
+            dialog=filedialog.askopenfilename,
+            operation="Opening file name",
+            filetypes=filetypes,
+            initialdir=initialdir,
+            initialfile=initialfile,
+            title=title,
+        )
 
     @classmethod
     def ask_and_open_file_names(
@@ -414,52 +2125,15 @@ class FileManager:
         :rtype: Optional[Union[Tuple[str, ...], str]]
         """
 
-        # Check if the initial directory has been passed
-        if initialdir:
-            # Convert the initial directory to a Path object
-            initialdir = cls._convert_to_path(path=initialdir)
-
-            # Check if the initial directory exists
-            if not cls.does_directory_exist(path=initialdir):
-                # Log the warning
-                print(
-                    f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Opening file names at '{initialdir.resolve()}' impossible: directory does not exist. Aborting..."
-                )
-
-                # Return None
-                return None
-
-        # Check if the initial file has been passed
-        if initialfile:
-            # Convert the initial file to a Path object
-            initialfile = cls._convert_to_path(path=initialfile)
-
-            # Check if the initial file exists
-            if not cls.does_file_exist(path=initialfile):
-                # Log the warning
-                print(
-                    f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Opening file names at '{initialfile.resolve()}' impossible: file does not exist. Aborting..."
-                )
-
-                # Return None
-                return None
-
-        try:
-            # Ask the user to open file names
-            return filedialog.askopenfilenames(
-                filetypes=filetypes,
-                initialdir=initialdir,
-                initialfile=initialfile,
-                title=title,
-            )
-        except Exception:
-            # Print the error
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to open file names at '{initialfile.resolve()}':\n{traceback.format_exc()}"
-            )
-
-            # Return None
-            return None
+        # Ask the user to open file names
+        return cls._ask(
+            dialog=filedialog.askopenfilenames,
+            operation="Opening file names",
+            filetypes=filetypes,
+            initialdir=initialdir,
+            initialfile=initialfile,
+            title=title,
+        )
 
     @classmethod
     def ask_and_save_file(
@@ -485,43 +2159,91 @@ class FileManager:
         :rtype: Optional[str]
         """
 
-        # Check if the initial directory has been passed
-        if initialdir:
-            # Convert the initial directory to a Path object
-            initialdir = cls._convert_to_path(path=initialdir)
+        # Ask the user to save a file
+        return cls._ask(
+            dialog=filedialog.asksaveasfilename,
+            operation="Saving file",
+            filetypes=filetypes,
+            initialdir=initialdir,
+            initialfile=initialfile,
+            title=title,
+        )
 
-            # Check if the initial directory exists
-            if not cls.does_directory_exist(path=initialdir):
-                # Log the warning
-                print(
-                    f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Saving file at '{initialdir.resolve()}' impossible: directory does not exist. Aborting..."
+    @classmethod
+    def batch_rename(
+        cls,
+        pairs: List[Tuple[Union[str, Path], Union[str, Path]]],
+    ) -> List[bool]:
+        """
+        Renames files, directories or symlinks and flushes each affected directory once
+
+        :param pairs: The pairs of current and new paths
+        :type pairs: List[Tuple[Union[str, Path], Union[str, Path]]]
+
+        :return: A list holding True for each path that was renamed, False otherwise
+        :rtype: List[bool]
+        """
+
+        # Initialize the list of results
+        results: List[bool] = []
+
+        # Initialize the list of paths that could not be processed
+        failed: List[str] = []
+
+        # Initialize the parent directories to flush (a dict keeps their order)
+        parents: Dict[str, None] = {}
+
+        for source, destination in pairs:
+            # Convert the paths to strings
+            source = os.fspath(source)
+            destination = os.fspath(destination)
+
+            try:
+                # Rename the path without flushing (fails if the destination exists)
+                _rename_noreplace(
+                    destination=destination,
+                    source=source,
                 )
 
-                # Return None
-                return None
+                # Add the result
+                results.append(True)
+            except OSError:
+                # Add the result
+                results.append(False)
 
-        # Check if the initial file has been passed
-        if initialfile:
-            # Convert the initial file to a Path object
-            initialfile = cls._convert_to_path(path=initialfile)
+                # Add the failed path
+                failed.append(source)
 
-            # Check if the initial file exists
-            if not cls.does_file_exist(path=initialfile):
+                # Continue with the next pair
+                continue
+
+            # Add the parent directories of both paths
+            parents[os.path.dirname(os.path.abspath(source))] = None
+            parents[os.path.dirname(os.path.abspath(destination))] = None
+
+        for parent in parents:
+            try:
+                # Flush the directory once for all the renames it received
+                _fsync_directory(path=parent)
+            except OSError:
                 # Log the warning
-                print(
-                    f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Saving file at '{initialfile.resolve()}' impossible: file does not exist. Aborting..."
+                logger.warning(
+                    "Flushing directory at '%s' impossible. Skipped...",
+                    parent,
                 )
 
-                # Return None
-                return None
+        # Check if any path could not be renamed
+        if failed:
+            # Log the warning
+            logger.warning(
+                "Renaming %s of %s paths impossible: %s. Skipped...",
+                len(failed),
+                len(results),
+                failed,
+            )
 
-        # Ask the user to save a file
-        return filedialog.asksaveasfilename(
-            filetypes=filetypes,
-            initialdir=initialdir,
-            initialfile=initialfile,
-            title=title,
-        )
+        # Return the results
+        return results
 
     @classmethod
     def copy_directory(
@@ -542,44 +2264,47 @@ class FileManager:
         """
 
         # Convert the source to a Path object
-        source = cls._convert_to_path(path=source)
+        source = _to_path(source)
 
         # Check if the source directory exists
-        if not cls.does_directory_exist(path=source):
+        if not _is_dir(source):
             # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Copying directory at '{source.resolve()}' impossible: source directory does not exist. Aborting..."
+            logger.warning(
+                "Copying directory at '%s' impossible: source directory does not exist. Aborting...",
+                source,
             )
 
             # Return False
             return False
 
         # Convert the destination to a Path object
-        destination = cls._convert_to_path(path=destination)
-
-        # Check if the destination directory exists
-        if cls.does_directory_exist(path=destination):
-            # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Copying directory at '{source.resolve()}' to '{destination.resolve()}' impossible: destination directory already exists. Aborting..."
-            )
-
-            # Return False
-            return False
+        destination = _to_path(destination)
 
         try:
-            # Copy the directory
-            shutil.copytree(
-                src=source,
-                dst=destination,
+            # Copy the directory (the destination is created with os.makedirs, which fails if it exists)
+            _copy_tree(
+                source=source,
+                destination=destination,
             )
 
             # Return True
             return True
+        except FileExistsError:
+            # Log the warning
+            logger.warning(
+                "Copying directory at '%s' to '%s' impossible: destination directory already exists. Aborting...",
+                source,
+                destination,
+            )
+
+            # Return False
+            return False
         except Exception:
-            # Print the error
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to copy directory at '{source.resolve()}' to '{destination.resolve()}':\n{traceback.format_exc()}"
+            # Log the error along with its traceback
+            logger.exception(
+                "Caught an exception while attempting to copy directory at '%s' to '%s'",
+                source,
+                destination,
             )
 
             # Return False
@@ -604,44 +2329,58 @@ class FileManager:
         """
 
         # Convert the source to a Path object
-        source = cls._convert_to_path(path=source)
+        source = _to_path(source)
 
         # Check if the source file exists
-        if not cls.does_file_exist(path=source):
+        if not _is_file(source):
             # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Copying file at '{source.resolve()}' impossible: source file does not exist. Aborting..."
+            logger.warning(
+                "Copying file at '%s' impossible: source file does not exist. Aborting...",
+                source,
             )
 
             # Return False
             return False
 
         # Convert the destination to a Path object
-        destination = cls._convert_to_path(path=destination)
+        destination = _to_path(destination)
+
+        try:
+            # Copy the file (the destination is created with O_EXCL, which fails if it exists)
+            _copy_file_contents(
+                source=source,
+                destination=destination,
+            )
 
-        # Check if the destination file exists
-        if cls.does_file_exist(path=destination):
+            # Return True
+            return True
+        except FileExistsError:
             # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Copying file at '{source.resolve()}' to '{destination.resolve()}' impossible: destination file already exists. Aborting..."
+            logger.warning(
+                "Copying file at '%s' to '%s' impossible: destination file already exists. Aborting...",
+                source,
+                destination,
             )
 
             # Return False
             return False
-
-        try:
-            # Copy the file
-            shutil.copyfile(
-                src=source,
-                dst=destination,
+        except _EXPECTED_ERRORS as exception:
+            # Log the warning
+            logger.warning(
+                "Copying file at '%s' to '%s' impossible: %s. Aborting...",
+                source,
+                destination,
+                exception.strerror,
             )
 
-            # Return True
-            return True
-        except Exception:
-            # Print the error
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to copy file at '{source.resolve()}' to '{destination.resolve()}':\n{traceback.format_exc()}"
+            # Return False
+            return False
+        except OSError:
+            # Log the error along with its traceback
+            logger.exception(
+                "Caught an exception while attempting to copy file at '%s' to '%s'",
+                source,
+                destination,
             )
 
             # Return False
@@ -666,13 +2405,14 @@ class FileManager:
         """
 
         # Convert the path to a Path object
-        path = cls._convert_to_path(path=path)
+        path = _to_path(path)
 
         # Check if the directory exists
-        if cls.does_directory_exist(path=path):
+        if _is_dir(path):
             # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Directory at '{path.resolve()}' already exists. Aborting..."
+            logger.warning(
+                "Directory at '%s' already exists. Aborting...",
+                path,
             )
 
             # Return False
@@ -684,10 +2424,21 @@ class FileManager:
 
             # Return True
             return True
-        except Exception:
-            # Print the error
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to create directory at '{path.resolve()}':\n{traceback.format_exc()}"
+        except _EXPECTED_ERRORS as exception:
+            # Log the warning
+            logger.warning(
+                "Creating directory at '%s' impossible: %s. Aborting...",
+                path,
+                exception.strerror,
+            )
+
+            # Return False
+            return False
+        except OSError:
+            # Log the error along with its traceback
+            logger.exception(
+                "Caught an exception while attempting to create directory at '%s'",
+                path,
             )
 
             # Return False
@@ -709,13 +2460,14 @@ class FileManager:
         """
 
         # Convert the path to a Path object
-        path = cls._convert_to_path(path=path)
+        path = _to_path(path)
 
         # Check if the file exists
-        if cls.does_file_exist(path=path):
+        if _is_file(path):
             # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | File at '{path.resolve()}' already exists. Aborting..."
+            logger.warning(
+                "File at '%s' already exists. Aborting...",
+                path,
             )
 
             # Return False
@@ -727,15 +2479,74 @@ class FileManager:
 
             # Return True
             return True
-        except Exception:
-            # Print the error
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to create file at '{path.resolve()}':\n{traceback.format_exc()}"
+        except _EXPECTED_ERRORS as exception:
+            # Log the warning
+            logger.warning(
+                "Creating file at '%s' impossible: %s. Aborting...",
+                path,
+                exception.strerror,
+            )
+
+            # Return False
+            return False
+        except OSError:
+            # Log the error along with its traceback
+            logger.exception(
+                "Caught an exception while attempting to create file at '%s'",
+                path,
             )
 
             # Return False
             return False
 
+    @classmethod
+    def create_files(
+        cls,
+        paths: List[Union[str, Path]],
+    ) -> List[bool]:
+        """
+        Creates files at the given paths
+
+        :param paths: The paths to create the files at
+        :type paths: List[Union[str, Path]]
+
+        :return: A list holding True for each file that was created, False otherwise
+        :rtype: List[bool]
+        """
+
+        # Initialize the list of results
+        results: List[bool] = []
+
+        # Initialize the list of paths that could not be processed
+        failed: List[str] = []
+
+        for path in [_to_path(path) for path in paths]:
+            try:
+                # Create the file (fails if the file already exists)
+                path.touch(exist_ok=False)
+
+                # Add the result
+                results.append(True)
+            except OSError:
+                # Add the result
+                results.append(False)
+
+                # Add the failed path
+                failed.append(str(path))
+
+        # Check if any file could not be created
+        if failed:
+            # Log the warning
+            logger.warning(
+                "Creating %s of %s files impossible: %s. Skipped...",
+                len(failed),
+                len(results),
+                failed,
+            )
+
+        # Return the results
+        return results
+
     @classmethod
     def create_symlink(
         cls,
@@ -755,51 +2566,48 @@ class FileManager:
         """
 
         # Convert the source to a Path object
-        source = cls._convert_to_path(path=source)
+        source = _to_path(source)
 
         # Check if the source exists
-        if not cls.does_exist(path=source):
+        if not cls.does_exist(source):
             # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Creating symlink at '{source.resolve()}' impossible: source file does not exist. Aborting..."
+            logger.warning(
+                "Creating symlink at '%s' impossible: source file does not exist. Aborting...",
+                source,
             )
 
             # Return False
             return False
 
         # Convert the target to a Path object
-        target = cls._convert_to_path(path=target)
+        target = _to_path(target)
 
         # Check if the target exists
-        if cls.does_exist(path=target):
+        if cls.does_exist(target):
             # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Creating symlink at '{source.resolve()}' to '{target.resolve()}' impossible: target file already exists. Aborting..."
+            logger.warning(
+                "Creating symlink at '%s' to '%s' impossible: target file already exists. Aborting...",
+                source,
+                target,
             )
 
             # Return False
             return False
 
         try:
-            if OS == "Windows":
-                # Create the symlink
-                os.symlink(
-                    src=source,
-                    dst=target,
-                )
-            else:
-                # Create the symlink
-                source.symlink_to(
-                    target=target,
-                    target_is_directory=target.is_dir(),
-                )
+            # Create the symlink
+            _symlink(
+                source=source,
+                target=target,
+            )
 
             # Return True
             return True
         except Exception:
-            # Print the error
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to create symlink at '{source.resolve()}':\n{traceback.format_exc()}"
+            # Log the error along with its traceback
+            logger.exception(
+                "Caught an exception while attempting to create symlink at '%s'",
+                source,
             )
 
             # Return False
@@ -821,38 +2629,49 @@ class FileManager:
         """
 
         # Convert the path to a Path object
-        path = cls._convert_to_path(path=path)
+        path = _to_path(path)
 
-        # Check if the directory exists
-        if not cls.does_directory_exist(path=path):
-            # Print the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Deleting directory at '{path.resolve()}' impossible: directory does not exist. Aborting..."
+        try:
+            # Delete the directory (fails if it does not exist or is not empty)
+            os.rmdir(path)
+
+            # Return True
+            return True
+        except FileNotFoundError:
+            # Log the warning
+            logger.warning(
+                "Deleting directory at '%s' impossible: directory does not exist. Aborting...",
+                path,
             )
 
             # Return False
             return False
-
-        # Check if the directory is empty
-        if not cls.is_directory_empty(path=path):
-            # Print the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Deleting directory at '{path.resolve()}' impossible: directory is not empty. Aborting..."
+        except _EXPECTED_ERRORS as exception:
+            # Log the warning
+            logger.warning(
+                "Deleting directory at '%s' impossible: %s. Aborting...",
+                path,
+                exception.strerror,
             )
 
             # Return False
             return False
+        except OSError as exception:
+            # Check if the directory is not empty (POSIX allows either errno)
+            if exception.errno in (errno.ENOTEMPTY, errno.EEXIST):
+                # Log the warning
+                logger.warning(
+                    "Deleting directory at '%s' impossible: directory is not empty. Aborting...",
+                    path,
+                )
 
-        try:
-            # Delete the directory
-            path.rmdir()
+                # Return False
+                return False
 
-            # Return True
-            return True
-        except Exception:
-            # Print the error
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to delete directory at '{path.resolve()}':\n{traceback.format_exc()}"
+            # Log the error along with its traceback
+            logger.exception(
+                "Caught an exception while attempting to delete directory at '%s'",
+                path,
             )
 
             # Return False
@@ -874,28 +2693,38 @@ class FileManager:
         """
 
         # Convert the path to a Path object
-        path = cls._convert_to_path(path=path)
-
-        # Check if the file exists
-        if not cls.does_file_exist(path=path):
-            # Print the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Deleting file at '{path.resolve()}' impossible: file does not exist. Aborting..."
-            )
-
-            # Return False
-            return False
+        path = _to_path(path)
 
         try:
-            # Delete the file
+            # Delete the file (fails if it does not exist)
             path.unlink()
 
             # Return True
             return True
-        except Exception:
-            # Print the error
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to delete file at '{path.resolve()}':\n{traceback.format_exc()}"
+        except FileNotFoundError:
+            # Log the warning
+            logger.warning(
+                "Deleting file at '%s' impossible: file does not exist. Aborting...",
+                path,
+            )
+
+            # Return False
+            return False
+        except _EXPECTED_ERRORS as exception:
+            # Log the warning
+            logger.warning(
+                "Deleting file at '%s' impossible: %s. Aborting...",
+                path,
+                exception.strerror,
+            )
+
+            # Return False
+            return False
+        except OSError:
+            # Log the error along with its traceback
+            logger.exception(
+                "Caught an exception while attempting to delete file at '%s'",
+                path,
             )
 
             # Return False
@@ -917,36 +2746,45 @@ class FileManager:
         """
 
         # Convert the path to a Path object
-        path = cls._convert_to_path(path=path)
-
-        # Check if the symlink exists
-        if not cls.does_exist(path=path):
-            # Print the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Deleting symlink at '{path.resolve()}' impossible: symlink does not exist. Aborting..."
-            )
-
-            # Return False
-            return False
+        path = _to_path(path)
 
         try:
-            # Delete the symlink
+            # Delete the symlink itself, dangling or not (fails if it does not exist)
             path.unlink()
 
             # Return True
             return True
-        except Exception:
-            # Print the error
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to delete symlink at '{path.resolve()}':\n{traceback.format_exc()}"
+        except FileNotFoundError:
+            # Log the warning
+            logger.warning(
+                "Deleting symlink at '%s' impossible: symlink does not exist. Aborting...",
+                path,
             )
 
             # Return False
             return False
+        except _EXPECTED_ERRORS as exception:
+            # Log the warning
+            logger.warning(
+                "Deleting symlink at '%s' impossible: %s. Aborting...",
+                path,
+                exception.strerror,
+            )
 
-    @classmethod
+            # Return False
+            return False
+        except OSError:
+            # Log the error along with its traceback
+            logger.exception(
+                "Caught an exception while attempting to delete symlink at '%s'",
+                path,
+            )
+
+            # Return False
+            return False
+
+    @staticmethod
     def does_exist(
-        cls,
         path: Union[str, Path],
     ) -> bool:
         """
@@ -959,15 +2797,11 @@ class FileManager:
         :rtype: bool
         """
 
-        # Convert the path to a Path object
-        path = cls._convert_to_path(path=path)
-
-        # Return whether the path exists
-        return path.exists()
+        # Return whether the path exists (a single GetFileAttributesW call on Windows)
+        return os.path.exists(path)
 
-    @classmethod
+    @staticmethod
     def does_directory_exist(
-        cls,
         path: Union[str, Path],
     ) -> bool:
         """
@@ -980,25 +2814,11 @@ class FileManager:
         :rtype: bool
         """
 
-        # Convert the path to a Path object
-        path = cls._convert_to_path(path=path)
-
-        # Check if the path is a directory
-        if not path.is_dir():
-            # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Directory at '{path.resolve()}' does not exist or is not a directory. Aborting..."
-            )
-
-            # Return False
-            return False
-
         # Return whether the directory exists
-        return path.exists()
+        return _is_dir(path)
 
-    @classmethod
+    @staticmethod
     def does_file_exist(
-        cls,
         path: Union[str, Path],
     ) -> bool:
         """
@@ -1011,25 +2831,28 @@ class FileManager:
         :rtype: bool
         """
 
-        # Convert the path to a Path object
-        path = cls._convert_to_path(path=path)
+        # Return whether the file exists
+        return _is_file(path)
 
-        # Check if the path is a file
-        if not path.is_file():
-            # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | File at '{path.resolve()}' does not exist or is not a file. Aborting..."
-            )
+    @staticmethod
+    def does_symlink_exist(
+        path: Union[str, Path],
+    ) -> bool:
+        """
+        Checks if a symlink exists at the given path
 
-            # Return False
-            return False
+        :param path: The path to check
+        :type path: Union[str, Path]
 
-        # Return whether the file exists
-        return path.exists()
+        :return: True if the symlink exists, False otherwise
+        :rtype: bool
+        """
 
-    @classmethod
+        # Return whether the symlink exists (os.path.islink accepts str and Path alike)
+        return os.path.islink(path)
+
+    @staticmethod
     def is_directory_empty(
-        cls,
         path: Union[str, Path],
     ) -> bool:
         """
@@ -1042,15 +2865,13 @@ class FileManager:
         :rtype: bool
         """
 
-        # Convert the path to a Path object
-        path = cls._convert_to_path(path=path)
-
-        # Return whether the directory is empty
-        return not any(path.iterdir())
+        # Stop at the first directory entry instead of listing the whole directory
+        with os.scandir(path) as iterator:
+            # Return whether the directory is empty
+            return next(iterator, None) is None
 
-    @classmethod
+    @staticmethod
     def is_file_empty(
-        cls,
         path: Union[str, Path],
     ) -> bool:
         """
@@ -1063,21 +2884,26 @@ class FileManager:
         :rtype: bool
         """
 
-        # Convert the path to a Path object
-        path = cls._convert_to_path(path=path)
+        try:
+            # Get the status of the path (a single stat call for type and size)
+            status: Optional[os.stat_result] = os.stat(path)
+        except (OSError, ValueError):
+            # Mark the path as missing
+            status = None
 
         # Check if the file exists
-        if not cls.does_file_exist(path=path):
+        if status is None or not stat.S_ISREG(status.st_mode):
             # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | File at '{path.resolve()}' does not exist or is not a file. Aborting..."
+            logger.warning(
+                "File at '%s' does not exist or is not a file. Aborting...",
+                path,
             )
 
             # Return False
             return False
 
         # Return whether the file is empty
-        return not path.stat().st_size
+        return not status.st_size
 
     @classmethod
     def move_directory(
@@ -1098,41 +2924,54 @@ class FileManager:
         """
 
         # Convert the path to a Path object
-        path = cls._convert_to_path(path=path)
+        path = _to_path(path)
 
-        # Check if the directory exists
-        if not cls.does_directory_exist(path=path):
+        # Convert the destination to a Path object
+        destination = _to_path(destination)
+
+        try:
+            # Move the directory (copies it when crossing filesystems, fails if the destination exists)
+            _move_tree(
+                destination=destination,
+                source=path,
+            )
+
+            # Return True
+            return True
+        except FileNotFoundError:
             # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Moving directory at '{path.resolve()}' impossible: directory does not exist. Aborting..."
+            logger.warning(
+                "Moving directory at '%s' impossible: directory does not exist. Aborting...",
+                path,
             )
 
             # Return False
             return False
+        except FileExistsError:
+            # Log the warning
+            logger.warning(
+                "Moving directory at '%s' impossible: destination directory already exists. Aborting...",
+                path,
+            )
 
-        # Convert the destination to a Path object
-        destination = cls._convert_to_path(destination)
-
-        # Check if the destination exists
-        if cls.does_directory_exist(destination):
+            # Return False
+            return False
+        except _EXPECTED_ERRORS as exception:
             # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Moving directory at '{path.resolve()}' impossible: destination directory already exists. Aborting..."
+            logger.warning(
+                "Moving directory at '%s' impossible: %s. Aborting...",
+                path,
+                exception.strerror,
             )
 
             # Return False
             return False
-
-        try:
-            # Move the directory
-            path.rename(target=destination)
-
-            # Return True
-            return True
-        except Exception:
-            # Print the error
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to move directory at '{path.resolve()}' to '{destination.resolve()}':\n{traceback.format_exc()}"
+        except OSError:
+            # Log the error along with its traceback
+            logger.exception(
+                "Caught an exception while attempting to move directory at '%s' to '%s'",
+                path,
+                destination,
             )
 
             # Return False
@@ -1157,41 +2996,54 @@ class FileManager:
         """
 
         # Convert the path to a Path object
-        path = cls._convert_to_path(path=path)
+        path = _to_path(path)
 
-        # Check if the file exists
-        if not cls.does_file_exist(path=path):
+        # Convert the destination to a Path object
+        destination = _to_path(destination)
+
+        try:
+            # Move the file (fails if it does not exist or the destination exists)
+            _rename_noreplace(
+                destination=destination,
+                source=path,
+            )
+
+            # Return True
+            return True
+        except FileNotFoundError:
             # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Moving file at '{path.resolve()}' impossible: file does not exist. Aborting..."
+            logger.warning(
+                "Moving file at '%s' impossible: file does not exist. Aborting...",
+                path,
             )
 
             # Return False
             return False
-
-        # Convert the destination to a Path object
-        destination = cls._convert_to_path(destination)
-
-        # Check if the destination exists
-        if cls.does_file_exist(destination):
+        except FileExistsError:
             # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Moving file at '{path.resolve()}' impossible: destination file already exists. Aborting..."
+            logger.warning(
+                "Moving file at '%s' impossible: destination file already exists. Aborting...",
+                path,
             )
 
             # Return False
             return False
+        except _EXPECTED_ERRORS as exception:
+            # Log the warning
+            logger.warning(
+                "Moving file at '%s' impossible: %s. Aborting...",
+                path,
+                exception.strerror,
+            )
 
-        try:
-            # Move the file
-            path.rename(target=destination)
-
-            # Return True
-            return True
-        except Exception:
-            # Print the error
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to move file at '{path.resolve()}' to '{destination.resolve()}':\n{traceback.format_exc()}"
+            # Return False
+            return False
+        except OSError:
+            # Log the error along with its traceback
+            logger.exception(
+                "Caught an exception while attempting to move file at '%s' to '%s'",
+                path,
+                destination,
             )
 
             # Return False
@@ -1201,18 +3053,18 @@ class FileManager:
     def open(
         cls,
         source: Union[str, Path],
-        file_task: FileTask,
+        file_task: Union[str, FileTask],
         content: Optional[str] = None,
         new_name: Optional[str] = None,
         target: Optional[Union[str, Path]] = None,
-    ) -> Union[bool, str]:
+    ) -> Optional[Union[bool, str]]:
         """
         Opens a file at the given path
 
         :param source: The source file to open
         :type source: Union[str, Path]
-        :param file_task: The file task to perform
-        :type file_task: FileTask
+        :param file_task: The file task to perform (a FileTask or its lower-cased name)
+        :type file_task: Union[str, FileTask]
         :param content: The content to write to a file
         :type content: Optional[str]
         :param new_name: The new name of the file
@@ -1220,124 +3072,106 @@ class FileManager:
         :param target: The target file to open to
         :type target: Optional[Union[str, Path]]
 
-        :return: True if the file was opened, False otherwise
-        :rtype: Union[bool, str]
+        :return: True if the task succeeded, False otherwise (the content or None for "read")
+        :rtype: Optional[Union[bool, str]]
+
+        Note: "create" creates a directory if the source is a str ending with a path separator
+        (Path objects drop the trailing separator), a file otherwise.
+        "copy", "move" and "empty" follow a symlink to pick the directory or file variant,
+        "delete" and "rename" act on the symlink itself
         """
 
-        if file_task == "copy":
-            return (
-                cls.copy_directory(
-                    source=source,
-                    destination=target,
-                )
-                if cls.does_directory_exist(path=source)
-                else cls.copy_file(
-                    source=source,
-                    destination=target,
-                )
-            )
+        # Coerce a task given by name to its FileTask once
+        task: Optional[FileTask] = (
+            file_task
+            if isinstance(file_task, FileTask)
+            else FileTask.__members__.get(str(file_task).upper())
+        )
 
-        if file_task == "create":
-            return (
-                cls.create_directory(path=source)
-                if cls.does_directory_exist(path=source)
-                else (
-                    cls.create_file(path=source)
-                    if cls.does_file_exist(path=source)
-                    else cls.create_symlink(path=source)
-                )
-            )
+        # Get the handler of the task
+        handler: Optional[Callable[..., Optional[Union[bool, str]]]] = (
+            None if task is None else _DISPATCH[task]
+        )
 
-        if file_task == "delete":
-            return (
-                cls.delete_directory(path=source)
-                if cls.does_directory_exist(path=source)
-                else (
-                    cls.delete_file(path=source)
-                    if cls.does_file_exist(path=source)
-                    else cls.delete_symlink(path=source)
-                )
+        # Check if the task is known
+        if handler is None:
+            # Log the warning
+            logger.warning(
+                "Performing task '%s' on '%s' impossible: unknown task. Aborting...",
+                file_task,
+                source,
             )
 
-        if file_task == "exists":
-            return (
-                cls.does_directory_exist(path=source)
-                if cls.does_directory_exist(path=source)
-                else (
-                    cls.does_file_exist(path=source)
-                    if cls.does_file_exist(path=source)
-                    else cls.does_symlink_exist(path=source)
-                )
-            )
+            # Return False
+            return False
 
-        if file_task == "empty":
-            return (
-                cls.is_directory_empty(path=source)
-                if cls.does_directory_exist(path=source)
-                else cls.is_file_empty(path=source)
-            )
+        # Run the handler with the source classified once (a single lstat call)
+        return handler(
+            cls,
+            source,
+            _lstat_kind(path=source),
+            content=content,
+            new_name=new_name,
+            target=target,
+        )
 
-        if file_task == "link":
-            return cls.create_symlink(
-                source=source,
-                target=target,
-            )
+    @classmethod
+    def read_file(
+        cls,
+        path: Union[str, Path],
+    ) -> Optional[str]:
+        """
+        Reads a file at the given path
 
-        if file_task == "move":
-            return (
-                cls.move_directory(
-                    path=source,
-                    destination=target,
-                )
-                if cls.does_directory_exist(path=source)
-                else cls.move_file(
-                    path=source,
-                    destination=target,
-                )
-            )
+        :param path: The path to read the file at
+        :type path: Union[str, Path]
 
-        if file_task == "read":
-            return cls.read_file(path=source)
+        :return: The content of the file if it was read, None otherwise
+        :rtype: Optional[str]
+        """
 
-        if file_task == "rename":
-            return (
-                cls.rename_directory(
-                    path=source,
-                    new_name=new_name,
-                )
-                if cls.does_directory_exist(path=source)
-                else (
-                    cls.rename_file(
-                        path=source,
-                        new_name=new_name,
-                    )
-                    if cls.does_file_exist(path=source)
-                    else cls.rename_symlink(
-                        path=source,
-                        new_name=new_name,
-                    )
-                )
+        # Convert the path to a Path object
+        path = _to_path(path)
+
+        try:
+            # Open, read and close the file (opening fails if it is missing or not readable)
+            return _read_text(path=path)
+        except FileNotFoundError:
+            # Log the warning
+            logger.warning(
+                "Reading file at '%s' impossible: file does not exist. Aborting...",
+                path,
             )
 
-        if file_task == "unpack":
-            return cls.unpack_archive(
-                path=source,
-                extract_to=target,
+            # Return None
+            return None
+        except _EXPECTED_ERRORS as exception:
+            # Log the warning
+            logger.warning(
+                "Reading file at '%s' impossible: %s. Aborting...",
+                path,
+                exception.strerror,
             )
 
-        if file_task == "write":
-            return cls.write_file(
-                path=source,
-                content=content,
+            # Return None
+            return None
+        except (OSError, ValueError):
+            # Log the error (including undecodable content) along with its traceback
+            logger.exception(
+                "Caught an exception while attempting to read file at '%s'",
+                path,
             )
 
+            # Return None
+            return None
+
     @classmethod
-    def read_file(
+    async def read_file_async(
         cls,
         path: Union[str, Path],
     ) -> Optional[str]:
         """
-        Reads a file at the given path
+        Reads a file at the given path without blocking the event loop
 
         :param path: The path to read the file at
         :type path: Union[str, Path]
@@ -1346,50 +3180,114 @@ class FileManager:
         :rtype: Optional[str]
         """
 
-        async def _read_file(path: Path) -> Optional[str]:
-            """
-            Reads a file at the given path
+        # Convert the path to a Path object
+        path = _to_path(path)
+
+        try:
+            # Open, read and close the file in a single hop (fails if missing or unreadable)
+            return await asyncio.get_running_loop().run_in_executor(
+                None,
+                _read_text,
+                path,
+            )
+        except FileNotFoundError:
+            # Log the warning
+            logger.warning(
+                "Reading file at '%s' impossible: file does not exist. Aborting...",
+                path,
+            )
+
+            # Return None
+            return None
+        except _EXPECTED_ERRORS as exception:
+            # Log the warning
+            logger.warning(
+                "Reading file at '%s' impossible: %s. Aborting...",
+                path,
+                exception.strerror,
+            )
+
+            # Return None
+            return None
+        except (OSError, ValueError):
+            # Log the error (including undecodable content) along with its traceback
+            logger.exception(
+                "Caught an exception while attempting to read file at '%s'",
+                path,
+            )
+
+            # Return None
+            return None
+
+    @classmethod
+    def read_files_uring(
+        cls,
+        paths: List[Union[str, Path]],
+    ) -> List[Optional[bytes]]:
+        """
+        Reads the raw content of files at the given paths, batching the reads through io_uring where available
+
+        :param paths: The paths to read the files at
+        :type paths: List[Union[str, Path]]
+
+        :return: The content of each file, None for each file that could not be read
+        :rtype: List[Optional[bytes]]
+        """
 
-            :param path: The path to read the file at
-            :type path: Path
+        # Convert the paths to Path objects
+        paths = [_to_path(path) for path in paths]
 
-            :return: The content of the file if it was read, None otherwise
-            :rtype: Optional[str]
-            """
+        # Initialize the list of results
+        results: Optional[List[Optional[bytes]]] = None
 
+        # Check if io_uring is available on this host
+        if _uring.is_available():
             try:
-                # Read the file
-                async with aiofiles.open(
-                    encoding="utf-8",
-                    file=path,
-                    mode="r",
-                ) as file:
-                    # Get and return the content of the file
-                    return await file.read()
+                # Submit all reads through a single ring
+                results = _uring.read_files(paths=[os.fspath(path) for path in paths])
             except Exception:
-                # Print the error
-                print(
-                    f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to read file at '{path.resolve()}':\n{traceback.format_exc()}"
+                # Log the error along with its traceback
+                logger.exception(
+                    "Caught an exception while attempting to read %s files through io_uring. Falling back to the thread pool",
+                    len(paths),
                 )
 
-                # Return None
-                return None
-
-        # Convert the path to a Path object
-        path = cls._convert_to_path(path=path)
+        # Check if the files still have to be read
+        if results is None:
+            # Read the files on the thread pool
+            with ThreadPoolExecutor() as executor:
+                results = list(
+                    executor.map(
+                        _read_bytes,
+                        paths,
+                    )
+                )
 
-        # Check if the file exists
-        if not cls.does_file_exist(path=path):
+        # Get the paths of the files that could not be read
+        failed: List[str] = [
+            str(path)
+            for (
+                path,
+                result,
+            ) in zip(
+                paths,
+                results,
+            )
+            if result is None
+        ]
+
+        # Check if any file could not be read
+        if failed:
             # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Reading file at '{path.resolve()}' impossible: file does not exist. Aborting..."
+            logger.warning(
+                "Reading %s of %s files impossible: %s. Skipped...",
+                len(failed),
+                len(results),
+                failed,
             )
 
-            # Return None
-            return None
-
-        # Run the async function and return the result
-        return asyncio.run(main=_read_file(path=path))
+        # Return the results
+        return results
 
     @classmethod
     def rename_directory(
@@ -1410,46 +3308,56 @@ class FileManager:
         """
 
         # Convert the path to a Path object
-        path = cls._convert_to_path(path=path)
+        path = _to_path(path)
 
-        # Check if the directory exists
-        if not cls.does_directory_exist(path=path):
+        # Build the new path next to the current one
+        new_name = Path(
+            path.parent,
+            new_name,
+        )
+
+        try:
+            # Rename the directory (fails if it does not exist or the new name exists)
+            _rename_noreplace(
+                destination=new_name,
+                source=path,
+            )
+
+            # Return True
+            return True
+        except FileNotFoundError:
             # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Renaming directory at '{path.resolve()}' impossible: directory does not exist. Aborting..."
+            logger.warning(
+                "Renaming directory at '%s' impossible: directory does not exist. Aborting...",
+                path,
             )
 
             # Return False
             return False
-
-        # Convert the new name to a Path object
-        new_name = cls._convert_to_path(
-            path=Path(
-                path.parent,
-                new_name,
+        except FileExistsError:
+            # Log the warning
+            logger.warning(
+                "Renaming directory at '%s' impossible: new name already exists. Aborting...",
+                path,
             )
-        )
 
-        # Check if the new name exists
-        if cls.does_directory_exist(path=new_name):
+            # Return False
+            return False
+        except _EXPECTED_ERRORS as exception:
             # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Renaming directory at '{path.resolve()}' impossible: new name already exists. Aborting..."
+            logger.warning(
+                "Renaming directory at '%s' impossible: %s. Aborting...",
+                path,
+                exception.strerror,
             )
 
             # Return False
             return False
-
-        try:
-            # Rename the directory
-            path.rename(target=new_name)
-
-            # Return True
-            return True
-        except Exception:
-            # Print the error
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to rename directory at '{path.resolve()}':\n{traceback.format_exc()}"
+        except OSError:
+            # Log the error along with its traceback
+            logger.exception(
+                "Caught an exception while attempting to rename directory at '%s'",
+                path,
             )
 
             # Return False
@@ -1474,46 +3382,56 @@ class FileManager:
         """
 
         # Convert the path to a Path object
-        path = cls._convert_to_path(path=path)
+        path = _to_path(path)
 
-        # Check if the file exists
-        if not cls.does_file_exist(path=path):
+        # Build the new path next to the current one
+        new_name = Path(
+            path.parent,
+            new_name,
+        )
+
+        try:
+            # Rename the file (fails if it does not exist or the new name exists)
+            _rename_noreplace(
+                destination=new_name,
+                source=path,
+            )
+
+            # Return True
+            return True
+        except FileNotFoundError:
             # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Renaming file at '{path.resolve()}' impossible: file does not exist. Aborting..."
+            logger.warning(
+                "Renaming file at '%s' impossible: file does not exist. Aborting...",
+                path,
             )
 
             # Return False
             return False
-
-        # Convert the new name to a Path object
-        new_name = cls._convert_to_path(
-            path=Path(
-                path.parent,
-                new_name,
+        except FileExistsError:
+            # Log the warning
+            logger.warning(
+                "Renaming file at '%s' impossible: new name already exists. Aborting...",
+                path,
             )
-        )
 
-        # Check if the new name exists
-        if cls.does_file_exist(path=new_name):
+            # Return False
+            return False
+        except _EXPECTED_ERRORS as exception:
             # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Renaming file at '{path.resolve()}' impossible: new name already exists. Aborting..."
+            logger.warning(
+                "Renaming file at '%s' impossible: %s. Aborting...",
+                path,
+                exception.strerror,
             )
 
             # Return False
             return False
-
-        try:
-            # Rename the file
-            path.rename(target=new_name)
-
-            # Return True
-            return True
-        except Exception:
-            # Print the error
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to rename file at '{path.resolve()}':\n{traceback.format_exc()}"
+        except OSError:
+            # Log the error along with its traceback
+            logger.exception(
+                "Caught an exception while attempting to rename file at '%s'",
+                path,
             )
 
             # Return False
@@ -1538,46 +3456,56 @@ class FileManager:
         """
 
         # Convert the path to a Path object
-        path = cls._convert_to_path(path=path)
+        path = _to_path(path)
+
+        # Build the new path next to the current one
+        new_name = Path(
+            path.parent,
+            new_name,
+        )
+
+        try:
+            # Rename the symlink (fails if it does not exist or the new name exists)
+            _rename_noreplace(
+                destination=new_name,
+                source=path,
+            )
 
-        # Check if the symlink exists
-        if not cls.does_symlink_exist(path=path):
+            # Return True
+            return True
+        except FileNotFoundError:
             # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Renaming symlink at '{path.resolve()}' impossible: symlink does not exist. Aborting..."
+            logger.warning(
+                "Renaming symlink at '%s' impossible: symlink does not exist. Aborting...",
+                path,
             )
 
             # Return False
             return False
-
-        # Convert the new name to a Path object
-        new_name = cls._convert_to_path(
-            path=Path(
-                path.parent,
-                new_name,
+        except FileExistsError:
+            # Log the warning
+            logger.warning(
+                "Renaming symlink at '%s' impossible: new name already exists. Aborting...",
+                path,
             )
-        )
 
-        # Check if the new name exists
-        if cls.does_symlink_exist(path=new_name):
+            # Return False
+            return False
+        except _EXPECTED_ERRORS as exception:
             # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Renaming symlink at '{path.resolve()}' impossible: new name already exists. Aborting..."
+            logger.warning(
+                "Renaming symlink at '%s' impossible: %s. Aborting...",
+                path,
+                exception.strerror,
             )
 
             # Return False
             return False
-
-        try:
-            # Rename the symlink
-            path.rename(target=new_name)
-
-            # Return True
-            return True
-        except Exception:
-            # Print the error
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to rename symlink at '{path.resolve()}':\n{traceback.format_exc()}"
+        except OSError:
+            # Log the error along with its traceback
+            logger.exception(
+                "Caught an exception while attempting to rename symlink at '%s'",
+                path,
             )
 
             # Return False
@@ -1602,24 +3530,62 @@ class FileManager:
         """
 
         # Convert the path to a Path object
-        path = cls._convert_to_path(path=path)
+        path = _to_path(path)
 
         # Convert the extract to to a Path object
-        extract_to = cls._convert_to_path(path=extract_to)
+        extract_to = _to_path(extract_to)
 
         try:
-            # Unpack the archive
-            Archive(filename=path).extractall(
-                auto_create_dir=True,
-                directory=extract_to,
-            )
+            # Get the lower-cased name of the archive to detect its format
+            name: str = path.name.lower()
+
+            # Check if the archive is a zip archive
+            if name.endswith(".zip"):
+                # Create the directory to extract to
+                extract_to.mkdir(
+                    exist_ok=True,
+                    parents=True,
+                )
+
+                # Unpack the archive in-process
+                _unpack_zip(
+                    path=path,
+                    extract_to=extract_to,
+                )
+            # Check if the archive is a tar archive
+            elif name.endswith(_TAR_SUFFIXES):
+                # Create the directory to extract to
+                extract_to.mkdir(
+                    exist_ok=True,
+                    parents=True,
+                )
+
+                # Unpack the archive in-process
+                _unpack_tar(
+                    path=path,
+                    extract_to=extract_to,
+                )
+            # Check if the archive is a 7z archive that py7zr can unpack in-process
+            elif not (
+                name.endswith(".7z")
+                and _unpack_7z(
+                    path=path,
+                    extract_to=extract_to,
+                )
+            ):
+                # Unpack other formats (e.g. rar) through the external tools
+                Archive(filename=path).extractall(
+                    auto_create_dir=True,
+                    directory=extract_to,
+                )
 
             # Return True
             return True
         except Exception:
-            # Print the error
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to unpack archive at '{path.resolve()}':\n{traceback.format_exc()}"
+            # Log the error along with its traceback
+            logger.exception(
+                "Caught an exception while attempting to unpack archive at '%s'",
+                path,
             )
 
             # Return False
@@ -1643,55 +3609,155 @@ class FileManager:
         :rtype: bool
         """
 
-        async def _write_file(path: Path, content: str) -> bool:
-            """
-            Writes content to a file at the given path
+        # Convert the path to a Path object
+        path = _to_path(path)
 
-            :param path: The path to write the content to
-            :type path: Path
-            :param content: The content to write to the file
-            :type content: str
+        try:
+            # Open, write and close the file (opening fails if the file does not exist)
+            _write_text(
+                path=path,
+                content=content,
+            )
 
-            :return: True if the content was written, False otherwise
-            :rtype: bool
-            """
+            # Return True
+            return True
+        except FileNotFoundError:
+            # Log the warning
+            logger.warning(
+                "Writing content to file at '%s' impossible: file does not exist. Aborting...",
+                path,
+            )
 
-            try:
-                async with aiofiles.open(
-                    encoding="utf-8",
-                    file=path,
-                    mode="w",
-                ) as file:
-                    await file.write(content)
-
-                # Return True
-                return True
-            except Exception:
-                # Print the error
-                print(
-                    f"{datetime.now().isoformat()} | {cls.__name__} | ERROR | Caught an exception while attempting to write content to file at '{path.resolve()}':\n{traceback.format_exc()}"
-                )
+            # Return False
+            return False
+        except _EXPECTED_ERRORS as exception:
+            # Log the warning
+            logger.warning(
+                "Writing content to file at '%s' impossible: %s. Aborting...",
+                path,
+                exception.strerror,
+            )
 
-                # Return False
-                return False
+            # Return False
+            return False
+        except (OSError, ValueError):
+            # Log the error (including content that cannot be encoded) along with its traceback
+            logger.exception(
+                "Caught an exception while attempting to write content to file at '%s'",
+                path,
+            )
+
+            # Return False
+            return False
+
+    @classmethod
+    async def write_file_async(
+        cls,
+        path: Union[str, Path],
+        content: str,
+    ) -> bool:
+        """
+        Writes content to a file at the given path without blocking the event loop
+
+        :param path: The path to write the content to
+        :type path: Union[str, Path]
+        :param content: The content to write to the file
+        :type content: str
+
+        :return: True if the content was written, False otherwise
+        :rtype: bool
+        """
 
         # Convert the path to a Path object
-        path = cls._convert_to_path(path=path)
+        path = _to_path(path)
 
-        # Check if the file exists
-        if not cls.does_file_exist(path=path):
+        try:
+            # Open, write and close the file in a single hop (opening fails if the file does not exist)
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                _write_text,
+                path,
+                content,
+            )
+
+            # Return True
+            return True
+        except FileNotFoundError:
             # Log the warning
-            print(
-                f"{datetime.now().isoformat()} | {cls.__name__} | WARNING | Writing content to file at '{path.resolve()}' impossible: file does not exist. Aborting..."
+            logger.warning(
+                "Writing content to file at '%s' impossible: file does not exist. Aborting...",
+                path,
             )
 
             # Return False
             return False
+        except _EXPECTED_ERRORS as exception:
+            # Log the warning
+            logger.warning(
+                "Writing content to file at '%s' impossible: %s. Aborting...",
+                path,
+                exception.strerror,
+            )
 
-        # Run the async function and return the result
-        return asyncio.run(
-            main=_write_file(
-                path=path,
-                content=content,
+            # Return False
+            return False
+        except (OSError, ValueError):
+            # Log the error (including content that cannot be encoded) along with its traceback
+            logger.exception(
+                "Caught an exception while attempting to write content to file at '%s'",
+                path,
             )
-        )
+
+            # Return False
+            return False
+
+    @classmethod
+    def write_files(
+        cls,
+        items: List[Tuple[Union[str, Path], str]],
+    ) -> List[bool]:
+        """
+        Writes content to files at the given paths
+
+        :param items: The pairs of paths and the content to write to them
+        :type items: List[Tuple[Union[str, Path], str]]
+
+        :return: A list holding True for each file that was written, False otherwise
+        :rtype: List[bool]
+        """
+
+        # Initialize the list of results
+        results: List[bool] = []
+
+        # Initialize the list of paths that could not be processed
+        failed: List[str] = []
+
+        for path, content in [(_to_path(path), content) for path, content in items]:
+            try:
+                # Write the content to the file (opening fails if the file does not exist)
+                _write_text(
+                    path=path,
+                    content=content,
+                )
+
+                # Add the result
+                results.append(True)
+            except (OSError, ValueError):
+                # Add the result (ValueError covers content that cannot be encoded)
+                results.append(False)
+
+                # Add the failed path
+                failed.append(str(path))
+
+        # Check if any file could not be written
+        if failed:
+            # Log the warning
+            logger.warning(
+                "Writing content to %s of %s files impossible: %s. Skipped...",
+                len(failed),
+                len(results),
+                failed,
+            )
+
+        # Return the results
+        return results
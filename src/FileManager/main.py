@@ -3,12 +3,22 @@ Author: Louis Goodnews
 Date: 2025-08-19
 """
 
+import logging
+import sys
+
 from core.core import FileManager
 
 
 def main() -> None:
     """ """
 
+    # Print the messages of the FileManager logger with a timestamp
+    logging.basicConfig(
+        format="%(asctime)s | FileManager | %(levelname)s | %(message)s",
+        level=logging.INFO,
+        stream=sys.stdout,
+    )
+
     # Print the current working directory
     print(FileManager.CWD)
 
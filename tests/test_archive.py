@@ -0,0 +1,70 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-15
+"""
+
+import os
+import zipfile
+
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from FileManager.core.core import FileManager, _zip_member_target
+
+
+@pytest.mark.parametrize(
+    ("filename", "expected"),
+    [
+        ("file.txt", ["file.txt"]),
+        ("directory/file.txt", ["directory", "file.txt"]),
+        ("/etc/passwd", ["etc", "passwd"]),
+        ("../../outside.txt", ["outside.txt"]),
+        ("directory/../../outside.txt", ["directory", "outside.txt"]),
+        ("./directory//file.txt", ["directory", "file.txt"]),
+    ],
+)
+def test_zip_member_target_stays_below_root(
+    filename: str,
+    expected: List[str],
+) -> None:
+    """
+    Tests that member names are resolved below the extraction root
+    """
+
+    assert _zip_member_target(
+        filename=filename,
+        root="root",
+    ) == os.path.join(
+        "root",
+        *expected,
+    )
+
+
+def test_unpack_zip_sanitises_member_names(tmp_path: Path) -> None:
+    """
+    Tests that unpacking a zip archive never writes outside the extraction directory
+    """
+
+    # Create an archive whose members try to escape the extraction directory
+    archive: Path = tmp_path / "archive.zip"
+
+    with zipfile.ZipFile(archive, "w") as file:
+        file.writestr("inside.txt", "inside")
+        file.writestr("../escaped.txt", "escaped")
+        file.writestr("/absolute.txt", "absolute")
+        file.writestr("nested/", "")
+        file.writestr("nested/file.txt", "nested")
+
+    # Unpack the archive
+    assert FileManager.unpack_archive(
+        extract_to=tmp_path / "out",
+        path=archive,
+    )
+
+    assert (tmp_path / "out" / "inside.txt").read_text() == "inside"
+    assert (tmp_path / "out" / "escaped.txt").read_text() == "escaped"
+    assert (tmp_path / "out" / "absolute.txt").read_text() == "absolute"
+    assert (tmp_path / "out" / "nested" / "file.txt").read_text() == "nested"
+    assert not (tmp_path / "escaped.txt").exists()
@@ -0,0 +1,78 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-15
+"""
+
+from pathlib import Path
+
+from FileManager.core.core import FileManager
+
+
+def test_create_files_reports_each_path(tmp_path: Path) -> None:
+    """
+    Tests that create_files returns one result per path and keeps going after a failure
+    """
+
+    # Create the file that already exists
+    (tmp_path / "existing.txt").write_text("keep")
+
+    # Create the files, one of which exists and one of which has no parent directory
+    results = FileManager.create_files(
+        paths=[
+            tmp_path / "first.txt",
+            tmp_path / "existing.txt",
+            tmp_path / "missing" / "second.txt",
+            str(tmp_path / "third.txt"),
+        ]
+    )
+
+    assert results == [True, False, False, True]
+    assert (tmp_path / "first.txt").is_file()
+    assert (tmp_path / "third.txt").is_file()
+    assert (tmp_path / "existing.txt").read_text() == "keep"
+
+
+def test_write_files_reports_each_path(tmp_path: Path) -> None:
+    """
+    Tests that write_files returns one result per item and keeps going after a failure
+    """
+
+    # Create the files to write to
+    (tmp_path / "first.txt").touch()
+    (tmp_path / "second.txt").touch()
+    (tmp_path / "directory").mkdir()
+
+    # Write the files, including a missing file, a directory and unencodable content
+    results = FileManager.write_files(
+        items=[
+            (tmp_path / "first.txt", "one"),
+            (tmp_path / "missing.txt", "two"),
+            (tmp_path / "directory", "three"),
+            (tmp_path / "second.txt", "\ud800"),
+            (str(tmp_path / "second.txt"), "four"),
+        ]
+    )
+
+    assert results == [True, False, False, False, True]
+    assert (tmp_path / "first.txt").read_text() == "one"
+    assert (tmp_path / "second.txt").read_text() == "four"
+    assert not (tmp_path / "missing.txt").exists()
+
+
+def test_write_file_rejects_unencodable_content(tmp_path: Path) -> None:
+    """
+    Tests that write_file returns False for content that cannot be encoded and leaves the file untouched
+    """
+
+    # Create the file to write to
+    path: Path = tmp_path / "file.txt"
+    path.write_text("keep")
+
+    assert (
+        FileManager.write_file(
+            content="\ud800",
+            path=path,
+        )
+        is False
+    )
+    assert path.read_text() == "keep"
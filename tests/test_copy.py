@@ -0,0 +1,154 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-15
+"""
+
+import errno
+import os
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from FileManager.core.core import FileManager
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"",
+        b"small",
+        os.urandom(1024 * 1024 + 1),
+    ],
+)
+def test_copy_file(
+    content: bytes,
+    tmp_path: Path,
+) -> None:
+    """
+    Tests that copy_file copies empty, small and large files
+    """
+
+    # Create the file to copy
+    (tmp_path / "source.bin").write_bytes(content)
+
+    assert FileManager.copy_file(
+        destination=tmp_path / "copy.bin",
+        source=tmp_path / "source.bin",
+    )
+
+    assert (tmp_path / "copy.bin").read_bytes() == content
+
+
+def test_copy_file_refuses_existing_destination(tmp_path: Path) -> None:
+    """
+    Tests that copy_file neither replaces an existing destination nor copies a missing source
+    """
+
+    # Create the file to copy and the existing destination
+    (tmp_path / "source.txt").write_text("source")
+    (tmp_path / "existing.txt").write_text("existing")
+
+    assert not FileManager.copy_file(
+        destination=tmp_path / "existing.txt",
+        source=tmp_path / "source.txt",
+    )
+    assert not FileManager.copy_file(
+        destination=tmp_path / "copy.txt",
+        source=tmp_path / "missing.txt",
+    )
+
+    assert (tmp_path / "existing.txt").read_text() == "existing"
+    assert not (tmp_path / "copy.txt").exists()
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    """
+    Creates a directory tree with nested files and an empty directory
+    """
+
+    # Create the tree
+    root: Path = tmp_path / "source"
+    (root / "a" / "empty").mkdir(parents=True)
+    (root / "b").mkdir()
+    (root / "file.txt").write_text("file")
+    (root / "a" / "deep.txt").write_text("deep")
+    (root / "b" / "other.txt").write_text("other")
+
+    return root
+
+
+def test_copy_directory(
+    tmp_path: Path,
+    tree: Path,
+) -> None:
+    """
+    Tests that copy_directory copies nested files and empty directories
+    """
+
+    assert FileManager.copy_directory(
+        destination=tmp_path / "copy",
+        source=tree,
+    )
+
+    assert (tmp_path / "copy" / "file.txt").read_text() == "file"
+    assert (tmp_path / "copy" / "a" / "deep.txt").read_text() == "deep"
+    assert (tmp_path / "copy" / "a" / "empty").is_dir()
+    assert (tmp_path / "copy" / "b" / "other.txt").read_text() == "other"
+    assert (tree / "file.txt").read_text() == "file"
+
+
+def test_copy_directory_refuses_existing_destination(
+    tmp_path: Path,
+    tree: Path,
+) -> None:
+    """
+    Tests that copy_directory does not copy into an existing destination
+    """
+
+    # Create the existing destination
+    (tmp_path / "copy").mkdir()
+
+    assert not FileManager.copy_directory(
+        destination=tmp_path / "copy",
+        source=tree,
+    )
+
+    assert not any((tmp_path / "copy").iterdir())
+
+
+def test_copy_directory_fails_on_unlistable_subdirectory(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    tree: Path,
+) -> None:
+    """
+    Tests that a subdirectory that cannot be listed fails the copy instead of being skipped
+    """
+
+    scandir = os.scandir
+
+    def _scandir(path: Any) -> Any:
+        """
+        Lists a directory, refusing to list the subdirectory "b"
+        """
+
+        # Check if the directory is the one to refuse
+        if os.fspath(path) == os.fspath(tree / "b"):
+            raise PermissionError(
+                errno.EACCES,
+                os.strerror(errno.EACCES),
+                os.fspath(path),
+            )
+
+        return scandir(path)
+
+    # Let listing the subdirectory fail
+    monkeypatch.setattr(os, "scandir", _scandir)
+
+    assert not FileManager.copy_directory(
+        destination=tmp_path / "copy",
+        source=tree,
+    )
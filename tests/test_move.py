@@ -0,0 +1,140 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-15
+"""
+
+import errno
+import os
+
+from pathlib import Path
+from typing import Union
+
+import pytest
+
+from FileManager.core import core
+from FileManager.core.core import FileManager
+
+
+def _exdev(
+    source: Union[str, Path],
+    destination: Union[str, Path],
+) -> None:
+    """
+    Raises the error of a rename across filesystems
+    """
+
+    raise OSError(
+        errno.EXDEV,
+        os.strerror(errno.EXDEV),
+        os.fspath(source),
+        None,
+        os.fspath(destination),
+    )
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    """
+    Creates a directory tree with a nested file, an empty directory and a symlink
+    """
+
+    # Create the tree
+    root: Path = tmp_path / "source"
+    (root / "nested" / "empty").mkdir(parents=True)
+    (root / "file.txt").write_text("file")
+    (root / "nested" / "deep.txt").write_text("deep")
+
+    # Create a symlink inside the tree, which must be moved as a link
+    os.symlink("file.txt", root / "link")
+
+    return root
+
+
+def test_move_directory_same_filesystem(
+    tmp_path: Path,
+    tree: Path,
+) -> None:
+    """
+    Tests that a directory is moved by a rename on the same filesystem
+    """
+
+    assert FileManager.move_directory(
+        destination=tmp_path / "moved",
+        path=tree,
+    )
+
+    assert not tree.exists()
+    assert (tmp_path / "moved" / "nested" / "deep.txt").read_text() == "deep"
+
+
+def test_move_directory_across_filesystems(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    tree: Path,
+) -> None:
+    """
+    Tests that a directory is copied and then removed when the rename fails with EXDEV
+    """
+
+    # Let every rename fail as if the destination were on another filesystem
+    monkeypatch.setattr(core, "_rename_noreplace", _exdev)
+
+    assert FileManager.move_directory(
+        destination=tmp_path / "moved",
+        path=tree,
+    )
+
+    assert not tree.exists()
+    assert (tmp_path / "moved" / "file.txt").read_text() == "file"
+    assert (tmp_path / "moved" / "nested" / "deep.txt").read_text() == "deep"
+    assert (tmp_path / "moved" / "nested" / "empty").is_dir()
+    assert os.readlink(tmp_path / "moved" / "link") == "file.txt"
+
+
+def test_move_directory_across_filesystems_refuses_existing_destination(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    tree: Path,
+) -> None:
+    """
+    Tests that the copy fallback neither replaces the destination nor removes the source
+    """
+
+    # Let every rename fail as if the destination were on another filesystem
+    monkeypatch.setattr(core, "_rename_noreplace", _exdev)
+
+    # Create the existing destination
+    (tmp_path / "moved").mkdir()
+
+    assert not FileManager.move_directory(
+        destination=tmp_path / "moved",
+        path=tree,
+    )
+
+    assert (tree / "file.txt").read_text() == "file"
+    assert not any((tmp_path / "moved").iterdir())
+
+
+def test_move_symlink_across_filesystems_keeps_the_target(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    tree: Path,
+) -> None:
+    """
+    Tests that a symlink to a directory is moved as a link and its target is left intact
+    """
+
+    # Let every rename fail as if the destination were on another filesystem
+    monkeypatch.setattr(core, "_rename_noreplace", _exdev)
+
+    # Create the symlink to the tree
+    os.symlink(tree, tmp_path / "link")
+
+    assert FileManager.move_directory(
+        destination=tmp_path / "moved",
+        path=tmp_path / "link",
+    )
+
+    assert not os.path.lexists(tmp_path / "link")
+    assert os.readlink(tmp_path / "moved") == os.fspath(tree)
+    assert (tree / "nested" / "deep.txt").read_text() == "deep"
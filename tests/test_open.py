@@ -0,0 +1,358 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-15
+"""
+
+import os
+import zipfile
+
+from pathlib import Path
+from typing import Callable, Union
+
+import pytest
+
+from FileManager.core.core import FileManager, FileTask
+
+
+# Spells a task as the FileTask itself or as its lower-cased name
+Spell = Callable[[FileTask], Union[str, FileTask]]
+
+
+@pytest.fixture(
+    params=[
+        "enum",
+        "str",
+    ]
+)
+def spell(request: pytest.FixtureRequest) -> Spell:
+    """
+    Runs a test with the tasks given as FileTask members and as their names
+    """
+
+    # Check if the test should pass the task by name
+    if request.param == "str":
+        return str
+
+    return lambda task: task
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    """
+    Creates a directory with a file and a symlink to it
+    """
+
+    # Create the directory and the symlink to it
+    (tmp_path / "directory").mkdir()
+    (tmp_path / "directory" / "file.txt").write_text("file")
+    os.symlink(tmp_path / "directory", tmp_path / "link")
+
+    return tmp_path
+
+
+def test_open_copy(
+    spell: Spell,
+    tree: Path,
+) -> None:
+    """
+    Tests that "copy" copies a file and the directory behind a symlink
+    """
+
+    assert FileManager.open(
+        file_task=spell(FileTask.COPY),
+        source=tree / "directory" / "file.txt",
+        target=tree / "copy.txt",
+    )
+    assert FileManager.open(
+        file_task=spell(FileTask.COPY),
+        source=tree / "link",
+        target=tree / "copy",
+    )
+
+    assert (tree / "copy.txt").read_text() == "file"
+    assert not (tree / "copy").is_symlink()
+    assert (tree / "copy" / "file.txt").read_text() == "file"
+
+
+def test_open_create(
+    spell: Spell,
+    tree: Path,
+) -> None:
+    """
+    Tests that "create" creates a file, a directory for a str with a trailing separator, and refuses existing paths
+    """
+
+    assert FileManager.open(
+        file_task=spell(FileTask.CREATE),
+        source=tree / "new.txt",
+    )
+    assert FileManager.open(
+        file_task=spell(FileTask.CREATE),
+        source=os.fspath(tree / "new") + os.sep,
+    )
+    assert not FileManager.open(
+        file_task=spell(FileTask.CREATE),
+        source=tree / "link",
+    )
+
+    assert (tree / "new.txt").is_file()
+    assert (tree / "new").is_dir()
+
+
+def test_open_delete(
+    spell: Spell,
+    tree: Path,
+) -> None:
+    """
+    Tests that "delete" removes a symlink to a directory without touching the directory, then a file and a directory
+    """
+
+    assert FileManager.open(
+        file_task=spell(FileTask.DELETE),
+        source=tree / "link",
+    )
+
+    assert not os.path.lexists(tree / "link")
+    assert (tree / "directory" / "file.txt").read_text() == "file"
+
+    assert FileManager.open(
+        file_task=spell(FileTask.DELETE),
+        source=tree / "directory" / "file.txt",
+    )
+    assert FileManager.open(
+        file_task=spell(FileTask.DELETE),
+        source=tree / "directory",
+    )
+
+    assert not (tree / "directory").exists()
+
+
+def test_open_empty(
+    spell: Spell,
+    tree: Path,
+) -> None:
+    """
+    Tests that "empty" checks files, directories and the directory behind a symlink
+    """
+
+    # Create an empty file and an empty directory
+    (tree / "empty.txt").touch()
+    (tree / "empty").mkdir()
+
+    assert FileManager.open(
+        file_task=spell(FileTask.EMPTY),
+        source=tree / "empty.txt",
+    )
+    assert FileManager.open(
+        file_task=spell(FileTask.EMPTY),
+        source=tree / "empty",
+    )
+    assert not FileManager.open(
+        file_task=spell(FileTask.EMPTY),
+        source=tree / "directory" / "file.txt",
+    )
+    assert not FileManager.open(
+        file_task=spell(FileTask.EMPTY),
+        source=tree / "link",
+    )
+
+
+def test_open_exists(
+    spell: Spell,
+    tree: Path,
+) -> None:
+    """
+    Tests that "exists" reports files, directories and symlinks
+    """
+
+    assert FileManager.open(
+        file_task=spell(FileTask.EXISTS),
+        source=tree / "link",
+    )
+    assert FileManager.open(
+        file_task=spell(FileTask.EXISTS),
+        source=tree / "directory",
+    )
+    assert not FileManager.open(
+        file_task=spell(FileTask.EXISTS),
+        source=tree / "missing",
+    )
+
+
+def test_open_link(
+    spell: Spell,
+    tree: Path,
+) -> None:
+    """
+    Tests that "link" creates a symlink at the target
+    """
+
+    assert FileManager.open(
+        file_task=spell(FileTask.LINK),
+        source=tree / "directory" / "file.txt",
+        target=tree / "file_link",
+    )
+
+    assert os.readlink(tree / "file_link") == os.fspath(tree / "directory" / "file.txt")
+
+
+def test_open_move(
+    spell: Spell,
+    tree: Path,
+) -> None:
+    """
+    Tests that "move" moves a file and moves a symlink to a directory as a link
+    """
+
+    assert FileManager.open(
+        file_task=spell(FileTask.MOVE),
+        source=tree / "link",
+        target=tree / "moved_link",
+    )
+    assert FileManager.open(
+        file_task=spell(FileTask.MOVE),
+        source=tree / "directory" / "file.txt",
+        target=tree / "moved.txt",
+    )
+
+    assert not os.path.lexists(tree / "link")
+    assert os.readlink(tree / "moved_link") == os.fspath(tree / "directory")
+    assert (tree / "moved.txt").read_text() == "file"
+    assert (tree / "directory").is_dir()
+
+
+def test_open_read(
+    spell: Spell,
+    tree: Path,
+) -> None:
+    """
+    Tests that "read" returns the content of a file and None for a missing file
+    """
+
+    assert (
+        FileManager.open(
+            file_task=spell(FileTask.READ),
+            source=tree / "directory" / "file.txt",
+        )
+        == "file"
+    )
+    assert (
+        FileManager.open(
+            file_task=spell(FileTask.READ),
+            source=tree / "missing.txt",
+        )
+        is None
+    )
+
+
+def test_open_rename(
+    spell: Spell,
+    tree: Path,
+) -> None:
+    """
+    Tests that "rename" renames a file and renames a symlink to a directory as a link
+    """
+
+    assert FileManager.open(
+        file_task=spell(FileTask.RENAME),
+        new_name="renamed_link",
+        source=tree / "link",
+    )
+    assert FileManager.open(
+        file_task=spell(FileTask.RENAME),
+        new_name="renamed.txt",
+        source=tree / "directory" / "file.txt",
+    )
+
+    assert not os.path.lexists(tree / "link")
+    assert os.readlink(tree / "renamed_link") == os.fspath(tree / "directory")
+    assert (tree / "directory" / "renamed.txt").read_text() == "file"
+
+
+def test_open_unpack(
+    spell: Spell,
+    tree: Path,
+) -> None:
+    """
+    Tests that "unpack" extracts an archive to the target
+    """
+
+    # Create the archive
+    with zipfile.ZipFile(tree / "archive.zip", "w") as file:
+        file.writestr("inside.txt", "inside")
+
+    assert FileManager.open(
+        file_task=spell(FileTask.UNPACK),
+        source=tree / "archive.zip",
+        target=tree / "out",
+    )
+
+    assert (tree / "out" / "inside.txt").read_text() == "inside"
+
+
+def test_open_write(
+    spell: Spell,
+    tree: Path,
+) -> None:
+    """
+    Tests that "write" writes the content to a file
+    """
+
+    assert FileManager.open(
+        content="written",
+        file_task=spell(FileTask.WRITE),
+        source=tree / "directory" / "file.txt",
+    )
+
+    assert (tree / "directory" / "file.txt").read_text() == "written"
+
+
+@pytest.mark.parametrize(
+    "task",
+    [
+        FileTask.COPY,
+        FileTask.LINK,
+        FileTask.MOVE,
+        FileTask.RENAME,
+        FileTask.UNPACK,
+        FileTask.WRITE,
+    ],
+)
+def test_open_missing_argument(
+    spell: Spell,
+    task: FileTask,
+    tree: Path,
+) -> None:
+    """
+    Tests that a task lacking its target, new name or content returns False and changes nothing
+    """
+
+    assert (
+        FileManager.open(
+            file_task=spell(task),
+            source=tree / "directory" / "file.txt",
+        )
+        is False
+    )
+
+    assert sorted(os.listdir(tree)) == [
+        "directory",
+        "link",
+    ]
+    assert (tree / "directory" / "file.txt").read_text() == "file"
+
+
+def test_open_unknown_task(tree: Path) -> None:
+    """
+    Tests that an unknown task returns False
+    """
+
+    assert (
+        FileManager.open(
+            file_task="shred",
+            source=tree / "directory" / "file.txt",
+        )
+        is False
+    )
+
+    assert (tree / "directory" / "file.txt").read_text() == "file"
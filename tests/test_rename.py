@@ -0,0 +1,220 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-15
+"""
+
+import os
+
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from FileManager.core import core
+from FileManager.core.core import FileManager
+
+
+def test_batch_rename_reports_each_pair(tmp_path: Path) -> None:
+    """
+    Tests that batch_rename returns one result per pair and keeps going after a failure
+    """
+
+    # Create the files to rename
+    (tmp_path / "first.txt").write_text("first")
+    (tmp_path / "second.txt").write_text("second")
+    (tmp_path / "taken.txt").write_text("taken")
+    (tmp_path / "directory").mkdir()
+
+    results: List[bool] = FileManager.batch_rename(
+        pairs=[
+            (tmp_path / "first.txt", tmp_path / "directory" / "first.txt"),
+            (tmp_path / "missing.txt", tmp_path / "found.txt"),
+            (tmp_path / "second.txt", tmp_path / "taken.txt"),
+            (str(tmp_path / "second.txt"), str(tmp_path / "renamed.txt")),
+        ]
+    )
+
+    assert results == [True, False, False, True]
+    assert (tmp_path / "directory" / "first.txt").read_text() == "first"
+    assert (tmp_path / "renamed.txt").read_text() == "second"
+    assert not (tmp_path / "found.txt").exists()
+
+
+def test_batch_rename_does_not_replace(tmp_path: Path) -> None:
+    """
+    Tests that batch_rename never replaces an existing destination, including dangling symlinks
+    """
+
+    # Create the file to rename and the existing destinations
+    (tmp_path / "source.txt").write_text("source")
+    (tmp_path / "existing.txt").write_text("existing")
+    os.symlink("nowhere", tmp_path / "dangling")
+
+    assert FileManager.batch_rename(
+        pairs=[
+            (tmp_path / "source.txt", tmp_path / "existing.txt"),
+            (tmp_path / "source.txt", tmp_path / "dangling"),
+        ]
+    ) == [False, False]
+
+    assert (tmp_path / "source.txt").read_text() == "source"
+    assert (tmp_path / "existing.txt").read_text() == "existing"
+    assert os.readlink(tmp_path / "dangling") == "nowhere"
+
+
+def test_batch_rename_flushes_each_parent_once(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """
+    Tests that each parent directory touched by a successful rename is flushed exactly once
+    """
+
+    # Record the flushed directories
+    flushed: List[str] = []
+
+    monkeypatch.setattr(
+        core,
+        "_fsync_directory",
+        lambda path: flushed.append(path),
+    )
+
+    # Create the files to rename
+    (tmp_path / "other").mkdir()
+
+    for index in range(3):
+        (tmp_path / f"{index}.txt").touch()
+
+    assert FileManager.batch_rename(
+        pairs=[
+            (tmp_path / "0.txt", tmp_path / "zero.txt"),
+            (tmp_path / "1.txt", tmp_path / "one.txt"),
+            (tmp_path / "2.txt", tmp_path / "other" / "two.txt"),
+            (tmp_path / "missing.txt", tmp_path / "nowhere" / "missing.txt"),
+        ]
+    ) == [True, True, True, False]
+
+    assert sorted(flushed) == sorted(
+        [
+            os.fspath(tmp_path),
+            os.fspath(tmp_path / "other"),
+        ]
+    )
+
+
+@pytest.fixture(
+    params=[
+        "renameat2",
+        "fallback",
+    ]
+)
+def rename_path(
+    monkeypatch: pytest.MonkeyPatch,
+    request: pytest.FixtureRequest,
+) -> str:
+    """
+    Runs a test with renameat2 (where the C library has it) and with the lstat-and-rename fallback
+    """
+
+    # Check if the test should use the fallback
+    if request.param == "fallback":
+        monkeypatch.setattr(core, "_RENAMEAT2", None)
+    elif core._RENAMEAT2 is None:
+        pytest.skip("renameat2 is not available")
+
+    return request.param
+
+
+def test_rename_file_does_not_replace(
+    rename_path: str,
+    tmp_path: Path,
+) -> None:
+    """
+    Tests that rename_file refuses an existing new name and a missing source
+    """
+
+    # Create the file to rename and the existing file
+    (tmp_path / "source.txt").write_text("source")
+    (tmp_path / "existing.txt").write_text("existing")
+
+    assert not FileManager.rename_file(
+        new_name="existing.txt",
+        path=tmp_path / "source.txt",
+    )
+    assert not FileManager.rename_file(
+        new_name="other.txt",
+        path=tmp_path / "missing.txt",
+    )
+    assert FileManager.rename_file(
+        new_name="renamed.txt",
+        path=tmp_path / "source.txt",
+    )
+
+    assert (tmp_path / "existing.txt").read_text() == "existing"
+    assert (tmp_path / "renamed.txt").read_text() == "source"
+
+
+def test_move_file_does_not_replace(
+    rename_path: str,
+    tmp_path: Path,
+) -> None:
+    """
+    Tests that move_file refuses an existing destination, including a dangling symlink
+    """
+
+    # Create the file to move and the existing destinations
+    (tmp_path / "source.txt").write_text("source")
+    (tmp_path / "existing.txt").write_text("existing")
+    os.symlink("nowhere", tmp_path / "dangling")
+
+    assert not FileManager.move_file(
+        destination=tmp_path / "existing.txt",
+        path=tmp_path / "source.txt",
+    )
+    assert not FileManager.move_file(
+        destination=tmp_path / "dangling",
+        path=tmp_path / "source.txt",
+    )
+
+    assert (tmp_path / "source.txt").read_text() == "source"
+    assert (tmp_path / "existing.txt").read_text() == "existing"
+    assert os.readlink(tmp_path / "dangling") == "nowhere"
+
+
+def test_rename_directory_does_not_replace_empty_directory(
+    rename_path: str,
+    tmp_path: Path,
+) -> None:
+    """
+    Tests that rename_directory refuses an existing empty directory, which rename(2) would replace
+    """
+
+    # Create the directory to rename and the existing empty directory
+    (tmp_path / "source").mkdir()
+    (tmp_path / "source" / "file.txt").touch()
+    (tmp_path / "existing").mkdir()
+
+    assert not FileManager.rename_directory(
+        new_name="existing",
+        path=tmp_path / "source",
+    )
+
+    assert (tmp_path / "source" / "file.txt").exists()
+    assert not any((tmp_path / "existing").iterdir())
+
+
+def test_rename_noreplace_rejects_null_bytes(tmp_path: Path) -> None:
+    """
+    Tests that a path with a null byte is rejected instead of being truncated by the C call
+    """
+
+    # Create the file a truncated path would point to
+    (tmp_path / "file").touch()
+
+    with pytest.raises(ValueError):
+        core._rename_noreplace(
+            destination=tmp_path / "other",
+            source=os.fspath(tmp_path / "file") + "\0suffix",
+        )
+
+    assert (tmp_path / "file").exists()
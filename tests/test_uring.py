@@ -0,0 +1,188 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-15
+"""
+
+import errno
+import os
+import subprocess
+import sys
+
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from FileManager.core import _uring
+from FileManager.core.core import FileManager
+
+
+# Whether io_uring and the liburing bindings are usable on this host
+requires_uring = pytest.mark.skipif(
+    not _uring.is_available(),
+    reason="io_uring is not available",
+)
+
+
+def _make_files(tmp_path: Path) -> List[Path]:
+    """
+    Creates a regular file, an empty file and a directory, and returns them along with a missing path
+    """
+
+    # Create the files
+    (tmp_path / "regular.txt").write_bytes(b"content")
+    (tmp_path / "empty.txt").touch()
+    (tmp_path / "directory").mkdir()
+
+    return [
+        tmp_path / "regular.txt",
+        tmp_path / "empty.txt",
+        tmp_path / "missing.txt",
+        tmp_path / "directory",
+    ]
+
+
+def test_read_files_uring_thread_pool(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """
+    Tests the per-file results of the thread pool fallback
+    """
+
+    # Force the thread pool fallback
+    monkeypatch.setattr(_uring, "is_available", lambda: False)
+
+    assert FileManager.read_files_uring(paths=_make_files(tmp_path)) == [
+        b"content",
+        b"",
+        None,
+        None,
+    ]
+
+
+@requires_uring
+def test_read_files_uring_ring(tmp_path: Path) -> None:
+    """
+    Tests the per-file results of the io_uring path
+    """
+
+    assert _uring.read_files(
+        paths=[os.fspath(path) for path in _make_files(tmp_path)]
+    ) == [
+        b"content",
+        b"",
+        None,
+        None,
+    ]
+
+
+@requires_uring
+def test_read_files_uring_proc() -> None:
+    """
+    Tests that pseudo-files reporting a size of 0 are read to EOF like the thread pool fallback does
+    """
+
+    paths: List[str] = [
+        "/proc/self/cmdline",
+        "/proc/cpuinfo",
+    ]
+
+    results = _uring.read_files(paths=paths)
+
+    assert all(results)
+    assert results[1] == Path(paths[1]).read_bytes()
+
+
+@requires_uring
+def test_read_files_uring_batches(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """
+    Tests that files spread over several batches keep their order
+    """
+
+    # Read two files per batch
+    monkeypatch.setattr(_uring, "_batch_size", lambda: 2)
+
+    # Create the files
+    paths: List[str] = []
+
+    for index in range(7):
+        path: Path = tmp_path / f"{index}.txt"
+        path.write_bytes(str(index).encode())
+
+        paths.append(os.fspath(path))
+
+    assert _uring.read_files(paths=paths) == [str(index).encode() for index in range(7)]
+
+
+def _emfile(*args: object, **kwargs: object) -> int:
+    """
+    Raises the error of a process without free file descriptors
+    """
+
+    raise OSError(
+        errno.EMFILE,
+        os.strerror(errno.EMFILE),
+    )
+
+
+@requires_uring
+def test_read_files_uring_emfile_is_an_error(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """
+    Tests that running out of file descriptors raises instead of marking files as unreadable
+    """
+
+    paths: List[str] = [os.fspath(path) for path in _make_files(tmp_path)]
+
+    # Let every open fail with EMFILE
+    monkeypatch.setattr(_uring.os, "open", _emfile)
+
+    with pytest.raises(OSError) as info:
+        _uring.read_files(paths=paths)
+
+    assert info.value.errno == errno.EMFILE
+
+
+def test_read_files_uring_falls_back_on_errors(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """
+    Tests that an io_uring error (e.g. EMFILE) falls back to the thread pool
+    """
+
+    # Let the io_uring path fail with EMFILE
+    monkeypatch.setattr(_uring, "is_available", lambda: True)
+    monkeypatch.setattr(_uring, "read_files", _emfile)
+
+    assert FileManager.read_files_uring(paths=_make_files(tmp_path)) == [
+        b"content",
+        b"",
+        None,
+        None,
+    ]
+
+
+def test_import_without_resource() -> None:
+    """
+    Tests that the package imports on platforms without the POSIX-only resource module (e.g. Windows)
+    """
+
+    # Import the package in a fresh interpreter that cannot import resource
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; sys.modules['resource'] = None; import FileManager.core._uring, FileManager",
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    assert process.returncode == 0, process.stderr